@@ -119,8 +119,9 @@ restore_system_config() {
     log "  CPU governor set to performance"
 
     # 3. Clear HLS cache (might have corrupted segments)
-    if [ -d "/var/www/hls" ]; then
-        sudo rm -rf /var/www/hls/*
+    # Caddy serves /hls/* straight from tmpfs, there is no web-root mirror.
+    if [ -d "/dev/shm/hls" ]; then
+        sudo rm -rf /dev/shm/hls/*
         log "  Cleared HLS cache"
     fi
 
@@ -191,14 +191,9 @@ class PanoramaService:
         """
         try:
             # Import here to avoid circular dependency
-            import sys
-            sys.path.insert(0, '/home/mislav/footballvision-pro/src/video-pipeline')
             from recording_service import get_recording_service
 
-            recording_service = get_recording_service()
-            status = recording_service.get_status()
-
-            return status.get('recording', False)
+            return get_recording_service().is_recording()
         except Exception as e:
             logger.error(f"Failed to check recording status: {e}")
             return False
@@ -637,8 +632,19 @@ class PanoramaService:
                         'error_code': 'MATCH_NOT_FOUND'
                     }
 
-                cam0_segments = sorted([str(f) for f in segments_dir.glob("cam0_*.mp4")])
-                cam1_segments = sorted([str(f) for f in segments_dir.glob("cam1_*.mp4")])
+                # One directory pass, bucketed by camera prefix
+                cam0_segments, cam1_segments = [], []
+                with os.scandir(segments_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.endswith(".mp4"):
+                            continue
+                        if name.startswith("cam0_"):
+                            cam0_segments.append(entry.path)
+                        elif name.startswith("cam1_"):
+                            cam1_segments.append(entry.path)
+                cam0_segments.sort()
+                cam1_segments.sort()
 
             if not cam0_segments or not cam1_segments:
                 return {
@@ -1460,12 +1466,23 @@ class PanoramaService:
                 f"filesink location={output_path}"
             )
 
+            # Set from the bus watch once the encoder has drained (EOS) or failed
+            encoder_done = threading.Event()
+
+            def on_encoder_eos(name):
+                logger.info(f"Encoder EOS: {name}")
+                encoder_done.set()
+
+            def on_encoder_error(name, err):
+                logger.error(f"Encoder error: {name} - {err}")
+                encoder_done.set()
+
             # Create encoder pipeline
             encoder_created = self.gst_manager.create_pipeline(
                 name=f'panorama_encode_{match_id}',
                 pipeline_description=encoder_pipeline_str,
-                on_eos=lambda name: logger.info(f"Encoder EOS: {name}"),
-                on_error=lambda name, err: logger.error(f"Encoder error: {name} - {err}"),
+                on_eos=on_encoder_eos,
+                on_error=on_encoder_error,
                 metadata={'match_id': match_id}
             )
 
@@ -1510,9 +1527,15 @@ class PanoramaService:
             logger.info("Sending EOS to encoder pipeline")
             appsrc.emit('end-of-stream')
 
-            # Wait for encoding to finish (max 60 seconds)
-            time.sleep(2)
-            self.gst_manager.stop_pipeline(f'panorama_encode_{match_id}')
+            # Wait for encoding to finish (max 60 seconds). mp4mux only
+            # writes the moov atom once EOS reaches the sink, so returning
+            # as soon as the bus reports it is both faster and safer than
+            # a fixed sleep.
+            if encoder_done.wait(timeout=60.0):
+                self.gst_manager.stop_pipeline(f'panorama_encode_{match_id}', wait_for_eos=False)
+            else:
+                logger.warning(f"Encoder for {match_id} did not reach EOS within 60s")
+                self.gst_manager.stop_pipeline(f'panorama_encode_{match_id}')
 
             # Update final state
             self.processing_state[match_id].update({
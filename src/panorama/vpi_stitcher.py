@@ -119,6 +119,9 @@ class VPIStitcher:
         # Cache for converted VPI images
         self._image_cache: Dict[str, vpi.Image] = {}
 
+        # Alpha ramps for the overlap region, keyed by its width
+        self._blend_weights: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
         logger.info(
             f"VPIStitcher initialized: {output_width}x{output_height}, "
             f"warp={self.warp_backend}, blend={self.blend_backend}, "
@@ -312,6 +315,22 @@ class VPIStitcher:
             logger.error(f"VPI perspective warp failed: {e}")
             raise RuntimeError(f"Perspective warp failed: {e}") from e
 
+    def _get_blend_weights(self, blend_width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get (alpha, 1 - alpha) ramps for a blend region, shaped to broadcast
+        over (height, width, channels). Built once per width, not per frame.
+        """
+        weights = self._blend_weights.get(blend_width)
+        if weights is None:
+            # Linear alpha from 1.0 (left) to 0.0 (right)
+            alpha = 1.0 - np.arange(blend_width, dtype=np.float64) / blend_width
+            weights = (
+                alpha.astype(np.float32).reshape(1, blend_width, 1),
+                (1.0 - alpha).astype(np.float32).reshape(1, blend_width, 1),
+            )
+            self._blend_weights[blend_width] = weights
+        return weights
+
     def _blend_images(
         self,
         img_left: vpi.Image,
@@ -371,17 +390,11 @@ class VPIStitcher:
 
             # Alpha blend in overlap region
             if blend_end > blend_start:
-                blend_width = blend_end - blend_start
-                for i in range(blend_width):
-                    # Linear alpha from 1.0 (left) to 0.0 (right)
-                    alpha = 1.0 - (i / blend_width)
-                    x = blend_start + i
-
-                    # Blend pixels
-                    panorama[:, x] = (
-                        alpha * left_np[:, x].astype(np.float32) +
-                        (1.0 - alpha) * right_np[:, x].astype(np.float32)
-                    ).astype(np.uint8)
+                alpha, inv_alpha = self._get_blend_weights(blend_end - blend_start)
+                panorama[:, blend_start:blend_end] = (
+                    alpha * left_np[:, blend_start:blend_end].astype(np.float32) +
+                    inv_alpha * right_np[:, blend_start:blend_end].astype(np.float32)
+                ).astype(np.uint8)
 
             # Convert blended panorama back to VPI image
             panorama_vpi = vpi.asimage(panorama, vpi.Format.BGR8)
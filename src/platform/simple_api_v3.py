@@ -7,7 +7,7 @@ Uses in-process GStreamer for instant, bulletproof operations
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import BaseModel
 from typing import Optional
@@ -20,7 +20,6 @@ import psutil
 import logging
 import signal
 import atexit
-import time
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -108,7 +107,7 @@ try:
     if preview_service.get_status().get('preview_active'):
         preview_service.stop_preview()
         logger.info("Stopped preview on startup")
-    if recording_service.get_status().get('recording'):
+    if recording_service.is_recording():
         recording_service.stop_recording(force=True)
         logger.info("Stopped recording on startup")
 except Exception as e:
@@ -180,17 +179,13 @@ def get_status():
     """Get overall system status"""
     api_requests.labels(endpoint='status', method='GET').inc()
     try:
-        recording_status = recording_service.get_status()
-        preview_status = preview_service.get_status()
+        status = _get_status_data()
         
         # Update Prometheus metrics
-        recording_active.set(1 if recording_status['recording'] else 0)
-        preview_active.set(1 if preview_status['preview_active'] else 0)
+        recording_active.set(1 if status['recording']['recording'] else 0)
+        preview_active.set(1 if status['preview']['preview_active'] else 0)
         
-        return {
-            "recording": recording_status,
-            "preview": preview_status
-        }
+        return status
     except Exception as e:
         logger.error(f"Failed to get status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -261,10 +256,13 @@ def start_recording(request: RecordingRequest):
                 stop_result = preview_service.stop_preview()
                 if not stop_result.get('success'):
                     logger.warning(f"Preview stop failed: {stop_result}, continuing anyway")
-                # Give pipelines a moment to tear down
-                time.sleep(1.0)
             except Exception as preview_err:
                 logger.error(f"Error stopping preview: {preview_err}, continuing anyway")
+
+        # Preview teardown is asynchronous, so a stop issued here or by an
+        # earlier request may still be releasing the sensors.
+        if not preview_service.wait_for_teardown(timeout=2.0):
+            logger.warning("Preview teardown still pending, continuing anyway")
         
         logger.info(f"Recording start requested: match_id={request.match_id}, force={request.force}, process_after={request.process_after_recording}")
 
@@ -409,6 +407,9 @@ def stop_preview(camera_id: Optional[int] = None):
         status = preview_service.get_status()
         if not status['preview_active']:
             preview_active.set(0)
+            # Teardown is asynchronous; hold the lock until the sensors are free.
+            if not preview_service.wait_for_teardown(timeout=2.0):
+                logger.warning("Preview teardown still pending while releasing lock")
             # Release pipeline lock when all previews are stopped or already down.
             pipeline_manager.release_lock(f"api-preview-{camera_id or 'all'}")
             logger.info(f"Preview inactive and lock released: {result}")
@@ -428,8 +429,7 @@ def restart_preview(request: PreviewRequest):
     """Restart preview (one or both cameras)"""
     api_requests.labels(endpoint='preview_restart', method='POST').inc()
     try:
-        recording_status = recording_service.get_status()
-        if recording_status.get('recording'):
+        if recording_service.is_recording():
             logger.warning("Preview restart rejected: recording is active")
             raise HTTPException(
                 status_code=400,
@@ -446,6 +446,30 @@ def restart_preview(request: PreviewRequest):
         logger.error(f"Failed to restart preview: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/v1/preview/hls/cam{camera_id}.m3u8")
+def get_preview_hls_playlist(camera_id: int):
+    """Serve the in-memory HLS playlist (PREVIEW_HLS_SINK=memory)"""
+    playlist = preview_service.get_hls_playlist(camera_id)
+    if playlist is None:
+        raise HTTPException(status_code=404, detail="Playlist not available")
+    return Response(
+        content=playlist,
+        media_type="application/vnd.apple.mpegurl",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+@app.get("/api/v1/preview/hls/cam{camera_id}_{sequence}.ts")
+def get_preview_hls_segment(camera_id: int, sequence: int):
+    """Serve an in-memory HLS segment (PREVIEW_HLS_SINK=memory)"""
+    segment = preview_service.get_hls_segment(camera_id, sequence)
+    if segment is None:
+        raise HTTPException(status_code=404, detail="Segment not available")
+    return Response(
+        content=segment,
+        media_type="video/mp2t",
+        headers={"Cache-Control": "no-cache"},
+    )
+
 
 # ============================================================================
 # Cleanup on shutdown
@@ -669,9 +693,10 @@ def _handle_ws_command(action: str, params: dict) -> dict:
         if preview_status.get("preview_active"):
             try:
                 preview_service.stop_preview()
-                time.sleep(1.0)
             except Exception:
                 pass
+        # An earlier preview stop may still be releasing the sensors.
+        preview_service.wait_for_teardown(timeout=2.0)
 
         result = recording_service.start_recording(
             match_id=match_id, force=force, process_after_recording=process_after
@@ -718,6 +743,7 @@ def _handle_ws_command(action: str, params: dict) -> dict:
         status = preview_service.get_status()
         if not status["preview_active"]:
             preview_active.set(0)
+            preview_service.wait_for_teardown(timeout=2.0)
             pipeline_manager.release_lock(f"api-preview-{camera_id or 'all'}")
         return result
 
@@ -814,6 +840,9 @@ def _handle_webrtc_ws_message(websocket: WebSocket, msg: dict) -> dict:
                     "error": result.get("message", "Failed to process WebRTC offer"),
                 },
             }
+        if result.get("pending"):
+            # Preview answers are pushed through the WebRTC emitter once ready.
+            return None
         return {
             "v": 1,
             "type": "webrtc_answer",
@@ -1167,31 +1196,40 @@ def get_recording_segments(match_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _remove_tree(directory: Path) -> tuple[int, int]:
+    """Delete a directory tree in one scandir walk; returns (files, bytes) removed."""
+    file_count = 0
+    total_size = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            # DirEntry type checks use the d_type scandir already read.
+            if entry.is_dir(follow_symlinks=False):
+                sub_files, sub_size = _remove_tree(Path(entry.path))
+                file_count += sub_files
+                total_size += sub_size
+                continue
+            if entry.is_file(follow_symlinks=False):
+                total_size += entry.stat(follow_symlinks=False).st_size
+                file_count += 1
+            os.unlink(entry.path)
+    os.rmdir(directory)
+    return file_count, total_size
+
+
 @app.delete("/api/v1/recordings/{match_id}")
 def delete_recording(match_id: str):
     """Delete a recording and all its files"""
     api_requests.labels(endpoint='recording_delete', method='DELETE').inc()
     try:
-        import shutil
-        
         match_dir = Path(f"/mnt/recordings/{match_id}")
         
         if not match_dir.exists():
             raise HTTPException(status_code=404, detail=f"Recording {match_id} not found")
         
-        # Calculate total size before deletion
-        total_size = 0
-        file_count = 0
-        for file_path in match_dir.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-                file_count += 1
-        
+        # Size the files as they are removed, so the tree is walked once
+        file_count, total_size = _remove_tree(match_dir)
         size_mb_freed = total_size / (1024 * 1024)
         
-        # Delete the entire recording directory
-        shutil.rmtree(match_dir)
-        
         logger.info(f"Deleted recording {match_id}: {file_count} files, {size_mb_freed:.2f} MB freed")
         
         return {
@@ -1221,17 +1259,17 @@ def get_processing_status(match_id: str):
         if status is None:
             # Check if archive files exist (processing completed)
             match_dir = Path(f"/mnt/recordings/{match_id}")
-            cam0_archive = match_dir / "cam0_archive.mp4"
-            cam1_archive = match_dir / "cam1_archive.mp4"
+            cam0_exists = (match_dir / "cam0_archive.mp4").exists()
+            cam1_exists = (match_dir / "cam1_archive.mp4").exists()
 
-            if cam0_archive.exists() or cam1_archive.exists():
+            if cam0_exists or cam1_exists:
                 return {
                     "processing": False,
                     "completed": True,
                     "message": "Processing complete",
                     "archives": {
-                        "cam0": cam0_archive.exists(),
-                        "cam1": cam1_archive.exists()
+                        "cam0": cam0_exists,
+                        "cam1": cam1_exists
                     }
                 }
             else:
@@ -27,6 +27,12 @@ interface CandidatePayload {
   sdpMLineIndex: number;
 }
 
+interface CandidateBatchPayload {
+  session_id: string;
+  stream_kind: StreamKind;
+  candidates: Array<{ candidate: string; sdpMLineIndex: number }>;
+}
+
 interface PendingSignal<T> {
   resolve: (value: T) => void;
   reject: (error: Error) => void;
@@ -125,6 +131,25 @@ class WebRtcService {
       }),
     );
 
+    this.unsubs.push(
+      wsManager.onMessageType('webrtc_ice_candidates', async (msg) => {
+        const data = msg?.data as CandidateBatchPayload;
+        const peerState = this.peersBySession.get(data?.session_id);
+        if (!peerState || !data?.candidates?.length) return;
+        for (const item of data.candidates) {
+          if (!item?.candidate) continue;
+          try {
+            await peerState.peer.addIceCandidate({
+              candidate: item.candidate,
+              sdpMLineIndex: item.sdpMLineIndex,
+            });
+          } catch (err) {
+            console.warn('[WebRTC] Failed to add remote ICE candidate', err);
+          }
+        }
+      }),
+    );
+
     this.unsubs.push(
       wsManager.onMessageType('webrtc_error', (msg) => {
         const data = msg?.data ?? {};
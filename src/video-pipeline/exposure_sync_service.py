@@ -8,7 +8,7 @@ every 10 seconds to keep brightness consistent while avoiding flicker.
 Key features:
 - 10-second minimum adjustment interval
 - Both cameras always use SAME exposure compensation value
-- Analyzes HLS segments to measure brightness
+- Analyzes HLS segments (on tmpfs or in memory) to measure brightness
 - Gradual adjustments (max ±0.3 per update)
 - Thread-safe
 """
@@ -18,7 +18,7 @@ import time
 import logging
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -59,6 +59,9 @@ class ExposureSyncService:
 
         # HLS segment locations for brightness analysis
         self.hls_base_dir = Path("/dev/shm/hls")
+        # Optional in-memory segment source (camera_id -> latest .ts bytes),
+        # used instead of hls_base_dir when preview HLS is served from memory
+        self.segment_source: Optional[Callable[[int], Optional[bytes]]] = None
 
         # Control
         self.running = False
@@ -200,17 +203,24 @@ class ExposureSyncService:
             Average brightness (0-255) or None if analysis failed
         """
         try:
-            # Get most recent segment (by modification time)
-            segments = list(self.hls_base_dir.glob(f"cam{camera_id}_*.ts"))
-            if not segments:
-                return None
-
-            latest_segment = max(segments, key=lambda p: p.stat().st_mtime)
+            segment_data = None
+            if self.segment_source is not None:
+                segment_data = self.segment_source(camera_id)
+                if not segment_data:
+                    return None
+                segment_input = 'pipe:0'
+            else:
+                # Get most recent segment (by modification time)
+                segments = list(self.hls_base_dir.glob(f"cam{camera_id}_*.ts"))
+                if not segments:
+                    return None
+
+                segment_input = str(max(segments, key=lambda p: p.stat().st_mtime))
 
             # Extract a downscaled grayscale frame and calculate average pixel value
             # This is much more reliable than signalstats which doesn't log properly
             cmd = [
-                'ffmpeg', '-i', str(latest_segment),
+                'ffmpeg', '-i', segment_input,
                 '-vf', 'scale=100:100,format=gray',  # Small grayscale frame
                 '-vframes', '1',
                 '-f', 'rawvideo',  # Raw pixel data
@@ -219,6 +229,7 @@ class ExposureSyncService:
 
             result = subprocess.run(
                 cmd,
+                input=segment_data,
                 capture_output=True,
                 timeout=2.0
             )
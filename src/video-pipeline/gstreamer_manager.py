@@ -158,6 +158,9 @@ class GStreamerManager:
                         err, debug = message.parse_error()
                         logger.error(f"Pipeline '{name}': {err.message}")
                         logger.debug(f"Pipeline '{name}': Debug info: {debug}")
+                        # Record ERROR before the callbacks run, so any status
+                        # they (or a concurrent reader) rebuild sees the failure.
+                        self._update_pipeline_state(name, PipelineState.ERROR, str(err))
                         if on_error:
                             metadata_ref = self.pipelines.get(name, {}).get('metadata', {})
                             try:
@@ -167,7 +170,6 @@ class GStreamerManager:
                                     on_error(name, str(err))
                                 except TypeError:
                                     on_error(name)
-                        self._update_pipeline_state(name, PipelineState.ERROR, str(err))
                     elif t == Gst.MessageType.WARNING:
                         warn, debug = message.parse_warning()
                         logger.warning(f"Pipeline '{name}': {warn.message}")
@@ -265,72 +267,77 @@ class GStreamerManager:
                     "error": None,
                 }
 
-            eos_received = False
-            timed_out = False
-            try:
-                logger.info(f"Stopping pipeline '{name}' (wait_for_eos={wait_for_eos})")
-                pipe_data['state'] = PipelineState.STOPPING
-
-                if wait_for_eos:
-                    # Send EOS to pipeline for clean shutdown
-                    pipeline.send_event(Gst.Event.new_eos())
-
-                    # Wait for EOS or timeout
-                    start = time.time()
-                    bus = pipeline.get_bus()
-                    while (time.time() - start) < timeout:
-                        msg = bus.timed_pop_filtered(
-                            int(0.1 * Gst.SECOND),
-                            Gst.MessageType.EOS | Gst.MessageType.ERROR
-                        )
-                        if msg:
-                            if msg.type == Gst.MessageType.EOS:
-                                logger.info(f"Pipeline '{name}': EOS received during stop")
-                                eos_received = True
-                                break
-                            if msg.type == Gst.MessageType.ERROR:
-                                err, _ = msg.parse_error()
-                                logger.warning(f"Pipeline '{name}': Error during EOS: {err.message}")
-                                break
-
-                    if wait_for_eos and not eos_received:
-                        timed_out = True
-                        logger.warning(
-                            "Pipeline '%s': EOS wait timed out after %.2fs; forcing NULL state",
-                            name,
-                            timeout,
-                        )
-
-                # Set to NULL state
-                ret = pipeline.set_state(Gst.State.NULL)
-                if ret == Gst.StateChangeReturn.FAILURE:
-                    logger.warning(f"Failed to set pipeline '{name}' to NULL state")
-
+            logger.info(f"Stopping pipeline '{name}' (wait_for_eos={wait_for_eos})")
+            pipe_data['state'] = PipelineState.STOPPING
+
+        # The EOS wait and NULL transition can block for up to `timeout`.
+        # They run outside pipelines_lock so stopping one pipeline never
+        # stalls status queries or the teardown of another pipeline.
+        eos_received = False
+        timed_out = False
+        try:
+            if wait_for_eos:
+                # Send EOS to pipeline for clean shutdown
+                pipeline.send_event(Gst.Event.new_eos())
+
+                # Wait for EOS or timeout
+                start = time.time()
+                bus = pipeline.get_bus()
+                while (time.time() - start) < timeout:
+                    msg = bus.timed_pop_filtered(
+                        int(0.1 * Gst.SECOND),
+                        Gst.MessageType.EOS | Gst.MessageType.ERROR
+                    )
+                    if msg:
+                        if msg.type == Gst.MessageType.EOS:
+                            logger.info(f"Pipeline '{name}': EOS received during stop")
+                            eos_received = True
+                            break
+                        if msg.type == Gst.MessageType.ERROR:
+                            err, _ = msg.parse_error()
+                            logger.warning(f"Pipeline '{name}': Error during EOS: {err.message}")
+                            break
+
+                if wait_for_eos and not eos_received:
+                    timed_out = True
+                    logger.warning(
+                        "Pipeline '%s': EOS wait timed out after %.2fs; forcing NULL state",
+                        name,
+                        timeout,
+                    )
+
+            # Set to NULL state
+            ret = pipeline.set_state(Gst.State.NULL)
+            if ret == Gst.StateChangeReturn.FAILURE:
+                logger.warning(f"Failed to set pipeline '{name}' to NULL state")
+
+            with self.pipelines_lock:
                 pipe_data['state'] = PipelineState.IDLE
                 pipe_data['start_time'] = None
-                logger.info(f"Pipeline '{name}' stopped successfully")
-                return {
-                    "success": True,
-                    "eos_received": eos_received,
-                    "timed_out": timed_out,
-                    "error": None,
-                }
+            logger.info(f"Pipeline '{name}' stopped successfully")
+            return {
+                "success": True,
+                "eos_received": eos_received,
+                "timed_out": timed_out,
+                "error": None,
+            }
 
-            except Exception as e:
-                logger.error(f"Exception stopping pipeline '{name}': {e}")
-                # Force to NULL on error
-                try:
-                    pipeline.set_state(Gst.State.NULL)
-                except Exception:
-                    pass
+        except Exception as e:
+            logger.error(f"Exception stopping pipeline '{name}': {e}")
+            # Force to NULL on error
+            try:
+                pipeline.set_state(Gst.State.NULL)
+            except Exception:
+                pass
+            with self.pipelines_lock:
                 pipe_data['state'] = PipelineState.ERROR
                 pipe_data['error'] = str(e)
-                return {
-                    "success": False,
-                    "eos_received": False,
-                    "timed_out": False,
-                    "error": str(e),
-                }
+            return {
+                "success": False,
+                "eos_received": False,
+                "timed_out": False,
+                "error": str(e),
+            }
 
     def stop_pipeline(self, name: str, wait_for_eos: bool = True, timeout: float = 5.0) -> bool:
         """
@@ -351,6 +358,62 @@ class GStreamerManager:
         """Stop a pipeline gracefully and return EOS/timeout details."""
         return self._stop_pipeline_internal(name, wait_for_eos=wait_for_eos, timeout=timeout)
 
+    def stop_pipeline_async(
+        self,
+        name: str,
+        on_complete: Optional[Callable[[str, bool], None]] = None
+    ) -> bool:
+        """
+        Tear a pipeline down to NULL without blocking the caller (no EOS).
+
+        The pipeline is marked STOPPING before returning, so status queries
+        never report it as running; the NULL transition then runs on a
+        background thread and on_complete(name, success) fires once it settles.
+
+        Returns:
+            True if the teardown was dispatched
+        """
+        with self.pipelines_lock:
+            if name not in self.pipelines:
+                logger.error(f"Pipeline '{name}' not found")
+                return False
+
+            pipe_data = self.pipelines[name]
+            already_idle = pipe_data['state'] == PipelineState.IDLE
+            if not already_idle:
+                pipe_data['state'] = PipelineState.STOPPING
+
+        def teardown():
+            if already_idle:
+                success = True
+            else:
+                details = self._stop_pipeline_internal(name, wait_for_eos=False)
+                success = bool(details.get("success"))
+            if on_complete:
+                try:
+                    on_complete(name, success)
+                except Exception as e:
+                    logger.error(f"Stop callback for pipeline '{name}' failed: {e}")
+
+        threading.Thread(target=teardown, daemon=True, name=f"GStreamer-Stop-{name}").start()
+        return True
+
+    def _teardown_locked(self, name: str):
+        """Set a registered pipeline to NULL and drop it (caller holds pipelines_lock)"""
+        pipe_data = self.pipelines.pop(name)
+        pipeline = pipe_data['pipeline']
+
+        # Cleanup. NULL is set directly rather than via stop_pipeline(), which
+        # would try to re-acquire pipelines_lock.
+        try:
+            bus = pipeline.get_bus()
+            bus.remove_signal_watch()
+            pipeline.set_state(Gst.State.NULL)
+        except Exception as e:
+            logger.warning(f"Error during pipeline '{name}' cleanup: {e}")
+
+        logger.info(f"Pipeline '{name}' removed")
+
     def remove_pipeline(self, name: str) -> bool:
         """Remove and cleanup a pipeline"""
         with self.pipelines_lock:
@@ -358,25 +421,32 @@ class GStreamerManager:
                 logger.warning(f"Pipeline '{name}' not found for removal")
                 return False
 
-            pipe_data = self.pipelines[name]
-            pipeline = pipe_data['pipeline']
+            self._teardown_locked(name)
+            return True
 
-            # Stop if running
-            if pipe_data['state'] in (PipelineState.RUNNING, PipelineState.STARTING):
-                self.stop_pipeline(name, wait_for_eos=False, timeout=1.0)
+    def ensure_removed_unless_running(self, name: str, keep_running: bool = True) -> Optional[PipelineState]:
+        """
+        Keep a running pipeline, otherwise tear down any stale registration.
 
-            # Cleanup
-            try:
-                bus = pipeline.get_bus()
-                bus.remove_signal_watch()
-                pipeline.set_state(Gst.State.NULL)
-            except Exception as e:
-                logger.warning(f"Error during pipeline '{name}' cleanup: {e}")
+        Check and removal happen under a single pipelines_lock acquisition.
 
-            # Remove from registry
-            del self.pipelines[name]
-            logger.info(f"Pipeline '{name}' removed")
-            return True
+        Args:
+            name: Pipeline name
+            keep_running: If False, a running pipeline is torn down too
+                (no EOS), e.g. when it is about to be replaced
+
+        Returns:
+            PipelineState.RUNNING if the pipeline was kept running, else None
+        """
+        with self.pipelines_lock:
+            pipe_data = self.pipelines.get(name)
+            if pipe_data is None:
+                return None
+            if keep_running and pipe_data['state'] == PipelineState.RUNNING:
+                return PipelineState.RUNNING
+
+            self._teardown_locked(name)
+            return None
 
     def get_pipeline_status(self, name: str) -> Optional[PipelineStatus]:
         """Get pipeline status"""
@@ -0,0 +1,144 @@
+"""
+In-memory HLS segmenter for preview pipelines.
+
+Preview HLS output is never persisted, so instead of hlssink2 writing a
+playlist and .ts segments to tmpfs, the preview pipeline can end in
+``mpegtsmux ! appsink`` and the segments are cut and kept here in a
+fixed-capacity ring per camera. The API serves the playlist and segments
+straight from memory.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+Segment = Tuple[int, float, bytes]
+
+logger = logging.getLogger(__name__)
+
+
+class HlsSegmentRing:
+    """
+    Fixed-capacity ring of MPEG-TS segments for one preview stream.
+
+    Muxed buffers are pushed from the appsink callback. A segment is cut at
+    the first keyframe after ``target_duration`` seconds, so every segment
+    starts on a keyframe just like hlssink2 output. Segment durations use
+    arrival time, which tracks capture time closely for a live sync=false
+    appsink.
+
+    Readers never lock: each rotation publishes a new immutable
+    ``(segments, playlist)`` tuple with a single attribute assignment, so
+    any number of HTTP handlers can serve from the ring while the streaming
+    thread keeps pushing.
+    """
+
+    def __init__(self, name_prefix: str, capacity: int = 8, target_duration: float = 2.0):
+        self.name_prefix = name_prefix
+        self.capacity = capacity
+        self.target_duration = target_duration
+
+        # (sequence, duration_seconds, payload), oldest first. Writer side
+        # only; _lock serialises segment rotation against reset().
+        self._segments: Deque[Segment] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._next_sequence = 0
+
+        # Snapshot read by playlist()/segment() without locking; replaced
+        # wholesale on every rotation, never mutated.
+        self._published: Tuple[Tuple[Segment, ...], Optional[bytes]] = ((), None)
+
+        # Playlist render buffer, rewritten in place on each rotation and
+        # grown only if a playlist ever outgrows it. Writer side only; the
+        # published playlist is an immutable copy of its first _playlist_len
+        # bytes.
+        self._playlist_buf = bytearray(4096)
+        self._playlist_len = 0
+
+        # Segment under construction (only touched by the streaming thread)
+        self._pending = bytearray()
+        self._pending_started_at: Optional[float] = None
+
+    def segment_name(self, sequence: int) -> str:
+        return f"{self.name_prefix}_{sequence:05d}.ts"
+
+    def push(self, data: bytes, keyframe: bool, now: Optional[float] = None) -> None:
+        """Append one muxed buffer, cutting a new segment on a keyframe boundary."""
+        if now is None:
+            now = time.monotonic()
+
+        if keyframe and self._pending_started_at is not None:
+            duration = now - self._pending_started_at
+            if duration >= self.target_duration:
+                self._close_segment(duration)
+
+        if self._pending_started_at is None:
+            if not keyframe:
+                # Segments must be independently decodable.
+                return
+            self._pending_started_at = now
+
+        self._pending += data
+
+    def _close_segment(self, duration: float) -> None:
+        payload = bytes(self._pending)
+        with self._lock:
+            self._segments.append((self._next_sequence, duration, payload))
+            self._next_sequence += 1
+            segments = tuple(self._segments)
+            self._render_playlist(segments)
+            playlist = bytes(memoryview(self._playlist_buf)[:self._playlist_len])
+            self._published = (segments, playlist)
+        self._pending = bytearray()
+        self._pending_started_at = None
+
+    def reset(self) -> None:
+        """Drop all segments (new stream). Sequence numbers keep increasing."""
+        with self._lock:
+            self._segments.clear()
+            self._playlist_len = 0
+            self._published = ((), None)
+        self._pending = bytearray()
+        self._pending_started_at = None
+
+    def _render_playlist(self, segments: Tuple[Segment, ...]) -> None:
+        target = max(self.target_duration, max(duration for _, duration, _ in segments))
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{int(target + 0.999)}",
+            f"#EXT-X-MEDIA-SEQUENCE:{segments[0][0]}",
+        ]
+        for sequence, duration, _ in segments:
+            lines.append(f"#EXTINF:{duration:.3f},")
+            lines.append(self.segment_name(sequence))
+        lines.append("")
+        rendered = "\n".join(lines).encode("ascii")
+
+        size = len(rendered)
+        if size > len(self._playlist_buf):
+            self._playlist_buf = bytearray(size * 2)
+        self._playlist_buf[:size] = rendered
+        self._playlist_len = size
+
+    def playlist(self) -> Optional[bytes]:
+        """Return the live playlist, or None until the first segment is complete."""
+        return self._published[1]
+
+    def segment(self, sequence: int) -> Optional[bytes]:
+        segments = self._published[0]
+        if not segments:
+            return None
+        # Sequence numbers are contiguous within a snapshot.
+        index = sequence - segments[0][0]
+        if 0 <= index < len(segments):
+            return segments[index][2]
+        return None
+
+    def latest_segment(self) -> Optional[bytes]:
+        segments = self._published[0]
+        if not segments:
+            return None
+        return segments[-1][2]
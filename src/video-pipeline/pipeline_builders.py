@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -13,6 +14,12 @@ SENSOR_WIDTH = 3840
 SENSOR_HEIGHT = 2160
 SENSOR_FORMAT = "NV12"
 
+# H.264 encoder: "x264" (CPU, default) or "nvv4l2h264enc" (NVENC), chosen
+# separately for preview (PREVIEW_ENCODER) and recording (RECORDING_ENCODER).
+# The Orin Nano has no NVENC block, so the hardware path is opt-in for
+# Jetson modules that have one.
+H264_ENCODERS = ("x264", "nvv4l2h264enc")
+
 
 def _resolve_config_path(config_path: str | None = None) -> Path:
     """Resolve the configuration file path.
@@ -30,12 +37,30 @@ def _resolve_config_path(config_path: str | None = None) -> Path:
     return repo_root / "config" / "camera_config.json"
 
 
+# path -> ((st_ino, st_mtime_ns, st_size), parsed config)
+_config_cache: Dict[Path, Tuple[Tuple[int, int, int], Dict]] = {}
+
+
 def load_camera_config(config_path: str | None = None) -> Dict:
-    """Load camera configuration from JSON file."""
+    """Load camera configuration from JSON file.
+
+    The parsed file is cached and only re-read when its inode, mtime or size
+    changes, so building pipelines for every camera/transport costs one
+    ``stat`` instead of a read and parse each time. The returned dict is
+    shared; treat it as read-only.
+    """
 
     path = _resolve_config_path(config_path)
+    st = os.stat(path)
+    version = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        config = json.load(f)
+    _config_cache[path] = (version, config)
+    return config
 
 
 def pixel_count_to_edge_coords(
@@ -53,13 +78,19 @@ def pixel_count_to_edge_coords(
     return left_edge, right_edge, top_edge, bottom_edge
 
 
-def _build_camera_source(camera_id: int, cam_config: Dict[str, Any]) -> Tuple[str, int, int]:
+def _build_camera_source(
+    camera_id: int,
+    cam_config: Dict[str, Any],
+    nvmm_output: bool = False,
+) -> Tuple[str, int, int]:
     """Build the common camera → CPU colour space conversion pipeline section.
 
     This function creates a GStreamer pipeline that:
     1. Captures video from nvarguscamerasrc (NVIDIA Argus camera)
     2. Crops the video using VIC hardware acceleration
-    3. Converts color space using VIC (NVMM to I420)
+    3. Converts color space using VIC (NVMM to I420), unless ``nvmm_output``
+       is set, in which case the cropped NV12 frames stay in NVMM for a
+       hardware encoder
 
     CRITICAL: nvvidconv crop coordinate system
     ==========================================
@@ -106,6 +137,7 @@ def _build_camera_source(camera_id: int, cam_config: Dict[str, Any]) -> Tuple[st
     Args:
         camera_id: Camera sensor ID (0 or 1)
         cam_config: Camera configuration dict from camera_config.json
+        nvmm_output: Skip the CPU download and end on NVMM NV12 caps
 
     Returns:
         Tuple of (pipeline_string, output_width, output_height)
@@ -155,7 +187,11 @@ def _build_camera_source(camera_id: int, cam_config: Dict[str, Any]) -> Tuple[st
         f"nvvidconv name=cropper{cropper_props} ! "
         f"video/x-raw(memory:NVMM),format={SENSOR_FORMAT},width={output_width},"
         f"height={output_height} ! "
+    )
+    if nvmm_output:
+        return pipeline, output_width, output_height
 
+    pipeline += (
         # Hardware colour conversion to CPU memory for x264enc
         "nvvidconv ! "
         f"video/x-raw,format=I420,width={output_width},height={output_height},"
@@ -165,6 +201,80 @@ def _build_camera_source(camera_id: int, cam_config: Dict[str, Any]) -> Tuple[st
     return pipeline, output_width, output_height
 
 
+def _h264_encoder(env_var: str) -> str:
+    encoder = os.getenv(env_var, "x264").strip().lower()
+    return encoder if encoder in H264_ENCODERS else "x264"
+
+
+def _preview_encoder() -> str:
+    return _h264_encoder("PREVIEW_ENCODER")
+
+
+def _build_preview_video_section(camera_id: int, cam_config: Dict[str, Any]) -> str:
+    """Build camera source + H.264 encode, shared by all preview transports.
+
+    With ``nvv4l2h264enc`` the cropped NV12 frames go from the VIC straight
+    into NVENC in NVMM, skipping the I420 download and the CPU encode.
+    """
+
+    if _preview_encoder() == "nvv4l2h264enc":
+        source_section, _, _ = _build_camera_source(camera_id, cam_config, nvmm_output=True)
+        return "".join(
+            [
+                source_section,
+                "nvv4l2h264enc name=enc bitrate=6000000 control-rate=1 preset-level=1 ",
+                "iframeinterval=60 idrinterval=60 insert-sps-pps=true insert-aud=true ",
+                "maxperf-enable=true ! ",
+            ]
+        )
+
+    source_section, _, _ = _build_camera_source(camera_id, cam_config)
+    return "".join(
+        [
+            source_section,
+            "x264enc name=enc speed-preset=ultrafast tune=zerolatency threads=0 ",
+            "bitrate=6000 key-int-max=60 b-adapt=false bframes=0 ",
+            "byte-stream=true aud=true intra-refresh=false ",
+            "option-string=repeat-headers=1:scenecut=0:open-gop=0 ! ",
+        ]
+    )
+
+
+# x264 recording profiles, keyed by quality preset name
+_RECORDING_PRESETS: Dict[str, Dict[str, Any]] = {
+    "high": {
+        "speed_preset": "superfast",
+        "tune": 0x00000000,  # No tune flags (not zerolatency)
+        "psy_tune": "film",
+        "bitrate": 25000,
+        "key_int_max": 90,
+        "bframes": 1,
+        "b_adapt": "true",
+        "options": "repeat-headers=1:scenecut=0:open-gop=0:ref=2:rc-lookahead=10:qpmin=18:qpmax=32:vbv-maxrate=25000:vbv-bufsize=50000"
+    },
+    "balanced": {
+        "speed_preset": "superfast",
+        "tune": 0x00000000,  # No tune flags
+        "psy_tune": "film",
+        "bitrate": 22000,
+        "key_int_max": 90,
+        "bframes": 1,
+        "b_adapt": "true",
+        "options": "repeat-headers=1:scenecut=0:open-gop=0:ref=2:rc-lookahead=10:qpmin=18:qpmax=32:vbv-maxrate=22000:vbv-bufsize=44000"
+    },
+    "fast": {
+        "speed_preset": "ultrafast",
+        "tune": 0x00000000,  # No tune flags
+        "psy_tune": "none",
+        "bitrate": 20000,
+        "key_int_max": 90,
+        "bframes": 0,
+        "b_adapt": "false",
+        "options": "repeat-headers=1:scenecut=0:open-gop=0:ref=1:rc-lookahead=0:qpmin=18:qpmax=34:vbv-maxrate=20000:vbv-bufsize=40000"
+    }
+}
+
+
 def build_recording_pipeline(camera_id: int, output_pattern: str, config_path: str = None, quality_preset: str = "high") -> str:
     """Build GStreamer pipeline string for recording.
 
@@ -183,56 +293,38 @@ def build_recording_pipeline(camera_id: int, output_pattern: str, config_path: s
     config = load_camera_config(config_path)
     cam_config = config["cameras"][str(camera_id)]
 
-    source_section, _, _ = _build_camera_source(camera_id, cam_config)
-
-    # Define quality presets
-    presets = {
-        "high": {
-            "speed_preset": "superfast",
-            "tune": 0x00000000,  # No tune flags (not zerolatency)
-            "psy_tune": "film",
-            "bitrate": 25000,
-            "key_int_max": 90,
-            "bframes": 1,
-            "b_adapt": "true",
-            "options": "repeat-headers=1:scenecut=0:open-gop=0:ref=2:rc-lookahead=10:qpmin=18:qpmax=32:vbv-maxrate=25000:vbv-bufsize=50000"
-        },
-        "balanced": {
-            "speed_preset": "superfast",
-            "tune": 0x00000000,  # No tune flags
-            "psy_tune": "film",
-            "bitrate": 22000,
-            "key_int_max": 90,
-            "bframes": 1,
-            "b_adapt": "true",
-            "options": "repeat-headers=1:scenecut=0:open-gop=0:ref=2:rc-lookahead=10:qpmin=18:qpmax=32:vbv-maxrate=22000:vbv-bufsize=44000"
-        },
-        "fast": {
-            "speed_preset": "ultrafast",
-            "tune": 0x00000000,  # No tune flags
-            "psy_tune": "none",
-            "bitrate": 20000,
-            "key_int_max": 90,
-            "bframes": 0,
-            "b_adapt": "false",
-            "options": "repeat-headers=1:scenecut=0:open-gop=0:ref=1:rc-lookahead=0:qpmin=18:qpmax=34:vbv-maxrate=20000:vbv-bufsize=40000"
-        }
-    }
-
     # Default to "high" if invalid preset provided
-    preset = presets.get(quality_preset, presets["high"])
+    preset = _RECORDING_PRESETS.get(quality_preset, _RECORDING_PRESETS["high"])
+
+    if _h264_encoder("RECORDING_ENCODER") == "nvv4l2h264enc":
+        # NVENC reads the cropped NV12 frames from NVMM; no I420 download.
+        source_section, _, _ = _build_camera_source(camera_id, cam_config, nvmm_output=True)
+        encoder_section = "".join(
+            [
+                f"nvv4l2h264enc name=enc bitrate={preset['bitrate'] * 1000} control-rate=1 ",
+                f"iframeinterval={preset['key_int_max']} idrinterval={preset['key_int_max']} ",
+                "profile=4 preset-level=1 insert-sps-pps=true maxperf-enable=true ! ",
+            ]
+        )
+    else:
+        source_section, _, _ = _build_camera_source(camera_id, cam_config)
+        encoder_section = "".join(
+            [
+                f"x264enc name=enc speed-preset={preset['speed_preset']} tune={preset['tune']} ",
+                f"psy-tune={preset['psy_tune']} threads=0 ",
+                f"bitrate={preset['bitrate']} key-int-max={preset['key_int_max']} ",
+                f"b-adapt={preset['b_adapt']} bframes={preset['bframes']} ",
+                # Recording consumers do not require AUD NAL units; disabling removes bitstream overhead.
+                f"aud=false byte-stream=false option-string={preset['options']} ! ",
+            ]
+        )
 
     pipeline = "".join(
         [
             source_section,
             # Queue isolation protects camera capture from encoder/sink backpressure.
             "queue name=preenc_queue max-size-time=2000000000 max-size-buffers=0 max-size-bytes=0 leaky=downstream ! ",
-            f"x264enc name=enc speed-preset={preset['speed_preset']} tune={preset['tune']} ",
-            f"psy-tune={preset['psy_tune']} threads=0 ",
-            f"bitrate={preset['bitrate']} key-int-max={preset['key_int_max']} ",
-            f"b-adapt={preset['b_adapt']} bframes={preset['bframes']} ",
-            # Recording consumers do not require AUD NAL units; disabling removes bitstream overhead.
-            f"aud=false byte-stream=false option-string={preset['options']} ! ",
+            encoder_section,
             "queue name=postenc_queue max-size-time=2000000000 max-size-buffers=0 max-size-bytes=0 leaky=downstream ! ",
             "h264parse config-interval=-1 ! ",
             "video/x-h264,stream-format=avc ! ",
@@ -254,15 +346,9 @@ def build_preview_pipeline(camera_id: int, hls_location: str, config_path: str =
     config = load_camera_config(config_path)
     cam_config = config["cameras"][str(camera_id)]
 
-    source_section, _, _ = _build_camera_source(camera_id, cam_config)
-
     pipeline = "".join(
         [
-            source_section,
-            "x264enc name=enc speed-preset=ultrafast tune=zerolatency threads=0 ",
-            "bitrate=6000 key-int-max=60 b-adapt=false bframes=0 ",
-            "byte-stream=true aud=true intra-refresh=false ",
-            "option-string=repeat-headers=1:scenecut=0:open-gop=0 ! ",
+            _build_preview_video_section(camera_id, cam_config),
             "h264parse config-interval=1 disable-passthrough=true ! ",
             "video/x-h264,stream-format=byte-stream ! ",
             "hlssink2 name=sink ",
@@ -278,6 +364,31 @@ def build_preview_pipeline(camera_id: int, hls_location: str, config_path: str =
     return pipeline
 
 
+def build_preview_memory_hls_pipeline(camera_id: int, config_path: str = None) -> str:
+    """Build GStreamer pipeline string for in-memory HLS preview.
+
+    Same encoder chain as :func:`build_preview_pipeline`, but the MPEG-TS
+    stream ends in an ``appsink`` named ``hlssink`` so segments can be cut and
+    served from memory (see ``hls_memory.HlsSegmentRing``) instead of being
+    written to tmpfs by hlssink2.
+    """
+
+    config = load_camera_config(config_path)
+    cam_config = config["cameras"][str(camera_id)]
+
+    pipeline = "".join(
+        [
+            _build_preview_video_section(camera_id, cam_config),
+            "h264parse config-interval=1 disable-passthrough=true ! ",
+            "video/x-h264,stream-format=byte-stream ! ",
+            "mpegtsmux name=mux alignment=7 ! ",
+            "appsink name=hlssink emit-signals=true sync=false max-buffers=256 drop=true",
+        ]
+    )
+
+    return pipeline
+
+
 def build_preview_webrtc_pipeline(
     camera_id: int,
     stun_server: str = "stun://stun.l.google.com:19302",
@@ -289,8 +400,6 @@ def build_preview_webrtc_pipeline(
     config = load_camera_config(config_path)
     cam_config = config["cameras"][str(camera_id)]
 
-    source_section, _, _ = _build_camera_source(camera_id, cam_config)
-
     webrtc_props = []
     if stun_server:
         webrtc_props.append(f"stun-server={stun_server}")
@@ -305,11 +414,7 @@ def build_preview_webrtc_pipeline(
     pipeline = "".join(
         [
             f"webrtcbin name=webrtc bundle-policy=max-bundle latency=0{webrtc_suffix} ",
-            source_section,
-            "x264enc name=enc speed-preset=ultrafast tune=zerolatency threads=0 ",
-            "bitrate=6000 key-int-max=60 b-adapt=false bframes=0 ",
-            "byte-stream=true aud=true intra-refresh=false ",
-            "option-string=repeat-headers=1:scenecut=0:open-gop=0 ! ",
+            _build_preview_video_section(camera_id, cam_config),
             "h264parse config-interval=1 disable-passthrough=true ! ",
             "rtph264pay pt=96 config-interval=1 aggregate-mode=zero-latency ! ",
             "application/x-rtp,media=video,encoding-name=H264,payload=96,clock-rate=90000 ! ",
@@ -333,16 +438,10 @@ def build_preview_rtsp_pipeline(
     config = load_camera_config(config_path)
     cam_config = config["cameras"][str(camera_id)]
 
-    source_section, _, _ = _build_camera_source(camera_id, cam_config)
-
     pipeline = "".join(
         [
             "( ",
-            source_section,
-            "x264enc name=enc speed-preset=ultrafast tune=zerolatency threads=0 ",
-            "bitrate=6000 key-int-max=60 b-adapt=false bframes=0 ",
-            "byte-stream=true aud=true intra-refresh=false ",
-            "option-string=repeat-headers=1:scenecut=0:open-gop=0 ! ",
+            _build_preview_video_section(camera_id, cam_config),
             "h264parse config-interval=1 disable-passthrough=true ! ",
             "rtph264pay name=pay0 pt=96 config-interval=1 aggregate-mode=zero-latency ",
             ")",
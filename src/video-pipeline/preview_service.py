@@ -9,13 +9,14 @@ Supports dual-camera preview with transport abstraction:
 
 import logging
 import os
+import secrets
+import stat
 import time
-import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from threading import Lock
 from typing import Any, Callable, Dict, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import threading
 
@@ -29,8 +30,24 @@ try:
 except (ImportError, ValueError):
     _HAS_RTSP_SERVER = False
 
+# WebRTC signalling bindings are optional -- HLS-only deployments lack them.
+# Versions are pinned once here instead of on every offer.
+try:
+    import gi as _gi
+    _gi.require_version("Gst", "1.0")
+    _gi.require_version("GstWebRTC", "1.0")
+    _gi.require_version("GstSdp", "1.0")
+    from gi.repository import Gst as _Gst
+    from gi.repository import GstWebRTC as _GstWebRTC
+    from gi.repository import GstSdp as _GstSdp
+    _HAS_WEBRTC = True
+except (ImportError, ValueError):
+    _Gst = _GstWebRTC = _GstSdp = None
+    _HAS_WEBRTC = False
+
 from gstreamer_manager import GStreamerManager, PipelineState
 import pipeline_builders
+from hls_memory import HlsSegmentRing
 from exposure_sync_service import get_exposure_sync_service
 
 logger = logging.getLogger(__name__)
@@ -40,6 +57,11 @@ Transport = str
 HLS: Transport = "hls"
 WEBRTC: Transport = "webrtc"
 
+# Max age (seconds) of the published status snapshot before a reader rebuilds it.
+STATUS_SNAPSHOT_TTL = 1.0
+# Local ICE candidates gathered within this window go out in one message
+ICE_BATCH_INTERVAL = 0.02
+
 
 class PreviewService:
     """
@@ -50,40 +72,137 @@ class PreviewService:
     """
 
     def __init__(self, hls_base_dir: str = "/dev/shm/hls"):
+        # HLS sink: "file" (hlssink2 into hls_base_dir) | "memory" (in-process ring)
+        self.hls_sink_mode = os.getenv("PREVIEW_HLS_SINK", "file").strip().lower()
+        if self.hls_sink_mode not in {"file", "memory"}:
+            self.hls_sink_mode = "file"
+
         self.hls_base_dir = Path(hls_base_dir)
-        self.hls_base_dir.mkdir(parents=True, exist_ok=True)
+        self._hls_base_dir_str = str(self.hls_base_dir)
+        if self.hls_sink_mode == "file":
+            self._ensure_hls_base_dir()
 
         self.gst_manager = GStreamerManager()
         self.state_lock = Lock()
 
         # Camera IDs
         self.camera_ids = [0, 1]
+        self._camera_id_set = frozenset(self.camera_ids)
+
+        # Per-camera lifecycle locks: start/stop of one camera never waits on
+        # the other camera's pipeline transitions.
+        self._camera_locks = [Lock() for _ in self.camera_ids]
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.camera_ids),
+            thread_name_prefix="preview_executor",
+        )
+        self._rtsp_lock = Lock()
+        # Exposure sync start is check-then-set under its own small lock so
+        # repeated start_preview calls skip the service entirely.
+        self._exposure_started = False
+        self._exposure_lock = Lock()
+
+        # Restart requests queued behind the round in flight, one batch per
+        # transport in arrival order. Callers wait on their batch's "done".
+        self._restart_lock = Lock()
+        self._restart_running = False
+        self._restart_queue: Dict[Transport, Dict[str, Any]] = {}
+
+        # cam_id -> Event set once an asynchronous pipeline teardown settles
+        self._pending_teardown: Dict[int, threading.Event] = {}
+
+        # Published status snapshot. Replaced wholesale (never mutated) so
+        # get_status can hand it out without taking state_lock. Lifecycle
+        # transitions mark it dirty; otherwise only uptimes are refreshed.
+        self._status_snapshot: Optional[Dict[str, Any]] = None
+        self._status_snapshot_at = 0.0
+        self._status_dirty = True
+        self._status_refresh_lock = Lock()
 
         # Runtime mode: hls | webrtc | dual
         self.preview_transport_mode = os.getenv("PREVIEW_TRANSPORT_MODE", "dual").strip().lower()
         if self.preview_transport_mode not in {"hls", "webrtc", "dual"}:
             self.preview_transport_mode = "dual"
 
+        # Per-camera state is kept as lists indexed by camera id (ids are
+        # always 0..N-1), so hot paths index instead of hashing.
+        self._pipeline_names = [f"preview_cam{cam_id}" for cam_id in self.camera_ids]
+        self._hls_paths = [str(self.hls_base_dir / f"cam{cam_id}.m3u8") for cam_id in self.camera_ids]
+        self._hls_urls = [self._hls_url(cam_id) for cam_id in self.camera_ids]
+
         # Track active state/transport
-        self.preview_active = {cam_id: False for cam_id in self.camera_ids}
-        self.preview_transport = {cam_id: HLS for cam_id in self.camera_ids}
+        self.preview_active = [False] * len(self.camera_ids)
+        # time.monotonic() when each camera's preview started (0.0 = stopped)
+        self._started_at = [0.0] * len(self.camera_ids)
+        self.preview_transport = [HLS] * len(self.camera_ids)
+
+        # Per-camera status entries with the static fields filled in; each
+        # snapshot copies these and sets the live fields.
+        self._status_templates = {
+            f"camera_{cam_id}": {
+                "active": False,
+                "state": "stopped",
+                "uptime": 0.0,
+                # Backward-compatible field retained in dual-stack mode.
+                "hls_url": self._hls_urls[cam_id],
+                "transport": HLS,
+                "stream_kind": f"main_cam{cam_id}",
+                "webrtc": None,
+            }
+            for cam_id in self.camera_ids
+        }
+
+        # In-memory HLS segment rings (used when hls_sink_mode == "memory")
+        self.hls_rings = {cam_id: HlsSegmentRing(f"cam{cam_id}") for cam_id in self.camera_ids}
 
         # WebRTC session state
         # session_id -> session metadata
         self.webrtc_sessions: Dict[str, Dict[str, Any]] = {}
         # connection_id -> set(session_id)
         self.connection_sessions: Dict[str, set[str]] = {}
+        # camera_id -> set(session_id)
+        self.sessions_by_camera: Dict[int, set[str]] = {cam_id: set() for cam_id in self.camera_ids}
+        # session_id -> status projection, kept in step with webrtc_sessions
+        self._active_sessions_view: Dict[str, Dict[str, Any]] = {}
         # Optional emitter callback: (connection_id, message_dict) -> None
         self.webrtc_emitter: Optional[Callable[[str, Dict[str, Any]], None]] = None
         # One-time callback registration guard per pipeline
         self.webrtc_callbacks_registered: set[str] = set()
+        # session_id -> local ICE candidates waiting for the next flush
+        self._ice_batch: Dict[str, list[Dict[str, Any]]] = {}
+        self._ice_batch_lock = Lock()
+        self._ice_batch_timer: Optional[threading.Timer] = None
+
+        # WebRTC runtime availability (bindings are probed at import time)
+        self._webrtc_supported = _HAS_WEBRTC
 
         # STUN/TURN settings for webrtcbin
         self.stun_server = os.getenv("WEBRTC_STUN_SERVER", "stun://stun.l.google.com:19302").strip()
         self.turn_server = os.getenv("WEBRTC_TURN_SERVER", "").strip() or None
+        # Split once: (scheme, host, port, query, username, password) or None
+        self._stun_parsed = self._split_ice_url(self.stun_server)
+        self._turn_parsed = self._split_ice_url(self.turn_server)
+        # Browser-side RTCIceServer list; the URLs are fixed for the service lifetime.
+        self._ice_servers_cache: list[dict[str, Any]] = [
+            server
+            for server in (
+                self._ice_server_for_browser(url, parsed)
+                for url, parsed in (
+                    (self.stun_server, self._stun_parsed),
+                    (self.turn_server, self._turn_parsed),
+                )
+                if url
+            )
+            if server
+        ]
 
         # RTSP relay settings (for go2rtc on VPS-02)
         self.relay_url = os.getenv("WEBRTC_RELAY_URL", "").strip() or None
+        # Transport used when callers don't ask for one. With a relay URL
+        # the default is WebRTC (served via go2rtc); in dual mode it is HLS.
+        self._default_transport: Transport = (
+            WEBRTC if self.relay_url or self.preview_transport_mode == WEBRTC else HLS
+        )
         self.rtsp_bind_address = os.getenv("RTSP_BIND_ADDRESS", "100.78.19.7").strip()
         self.rtsp_port = int(os.getenv("RTSP_PORT", "8554"))
 
@@ -94,42 +213,70 @@ class PreviewService:
         self._rtsp_loop_thread = None
 
         # Explicit RTSP mount state (GStreamerManager doesn't track these)
-        self.rtsp_mount_active: dict[int, bool] = {cam_id: False for cam_id in self.camera_ids}
+        self.rtsp_mount_active = [False] * len(self.camera_ids)
+
+        # Opt-in: keep an idle WebRTC pipeline running per camera so a joining
+        # client skips the pipeline and sensor start. ICE gathering still waits
+        # for the offer/answer. Holds the sensors.
+        self.webrtc_prewarm = (
+            os.getenv("PREVIEW_WEBRTC_PREWARM", "").strip().lower() in {"1", "true", "yes"}
+            and self.preview_transport_mode in {WEBRTC, "dual"}
+            and _HAS_WEBRTC
+            and not self.relay_url
+        )
+        if self.webrtc_prewarm:
+            threading.Thread(
+                target=self._prewarm_all_webrtc, daemon=True, name="preview-webrtc-prewarm"
+            ).start()
 
     # ---------------------------------------------------------------------
     # Transport + status
     # ---------------------------------------------------------------------
 
     def _resolve_transport(self, requested_transport: Optional[str]) -> Transport:
-        requested = (requested_transport or "").strip().lower()
-        if requested in {HLS, WEBRTC}:
-            return requested
-        # When a relay URL is configured, default to WebRTC (served via go2rtc).
-        if self.relay_url:
+        if not requested_transport:
+            return self._default_transport
+        requested = requested_transport.strip().lower()
+        if requested == HLS:
+            return HLS
+        if requested == WEBRTC:
             return WEBRTC
-        if self.preview_transport_mode == WEBRTC:
-            return WEBRTC
-        # In dual mode default to HLS unless caller explicitly asks for WebRTC.
-        return HLS
+        return self._default_transport
 
     def _is_webrtc_supported(self) -> bool:
-        try:
-            import gi
-            gi.require_version("GstWebRTC", "1.0")
-            gi.require_version("GstSdp", "1.0")
-            from gi.repository import GstWebRTC, GstSdp  # noqa: F401
-            return True
-        except Exception:
-            return False
+        return self._webrtc_supported
 
     @staticmethod
-    def _ice_server_for_browser(url: str) -> dict[str, Any] | None:
+    def _split_ice_url(url: Optional[str]) -> Optional[tuple]:
+        """Split a `scheme://` STUN/TURN URL into the parts browsers need."""
+        raw = (url or "").strip()
+        if "://" not in raw:
+            return None
+        try:
+            parsed = urlsplit(raw)
+            port = parsed.port
+        except ValueError as e:
+            # Runs at construction; a bad env var must not take the service down.
+            logger.warning("Ignoring malformed ICE server URL %r: %s", raw, e)
+            return None
+        return (
+            (parsed.scheme or "").lower(),
+            parsed.hostname,
+            port,
+            parsed.query,
+            parsed.username,
+            parsed.password,
+        )
+
+    @classmethod
+    def _ice_server_for_browser(cls, url: str, parsed: Optional[tuple] = None) -> dict[str, Any] | None:
         """Return an RTCIceServer dict for browsers.
 
         Note: GStreamer webrtcbin uses stun/turn URLs like `stun://host:port`,
         but browsers expect `stun:host:port` (no `//`). This helper normalizes
         the common schemes and extracts TURN credentials into `username` and
-        `credential` fields when provided.
+        `credential` fields when provided. `parsed` is the URL's
+        `_split_ice_url` result when the caller already has it.
         """
         raw = (url or "").strip()
         if not raw:
@@ -140,39 +287,33 @@ class PreviewService:
         if "://" not in raw:
             return {"urls": [raw]}
 
-        parsed = urlparse(raw)
-        scheme = (parsed.scheme or "").lower()
-        host = parsed.hostname
-        port = parsed.port
+        parts = parsed or cls._split_ice_url(raw)
+        if parts is None:
+            return None
+        scheme, host, port, query, username, password = parts
         if scheme not in {"stun", "stuns", "turn", "turns"} or not host:
             return None
 
         browser_url = f"{scheme}:{host}"
         if port:
             browser_url += f":{port}"
-        if scheme in {"turn", "turns"} and parsed.query:
-            browser_url += f"?{parsed.query}"
+        if scheme in {"turn", "turns"} and query:
+            browser_url += f"?{query}"
 
         server: dict[str, Any] = {"urls": [browser_url]}
         if scheme in {"turn", "turns"}:
-            if parsed.username:
-                server["username"] = parsed.username
-            if parsed.password:
-                server["credential"] = parsed.password
+            if username:
+                server["username"] = username
+            if password:
+                server["credential"] = password
         return server
 
     def get_ice_servers(self) -> list[dict[str, Any]]:
-        """Return browser-compatible RTCIceServer config (for RTCPeerConnection)."""
-        servers: list[dict[str, Any]] = []
-        if self.stun_server:
-            server = self._ice_server_for_browser(self.stun_server)
-            if server:
-                servers.append(server)
-        if self.turn_server:
-            server = self._ice_server_for_browser(self.turn_server)
-            if server:
-                servers.append(server)
-        return servers
+        """Return browser-compatible RTCIceServer config (for RTCPeerConnection).
+
+        The list is shared; callers must not mutate it.
+        """
+        return self._ice_servers_cache
 
     # ---------------------------------------------------------------------
     # RTSP relay (GstRtspServer)
@@ -182,6 +323,11 @@ class PreviewService:
         """Start the GstRtspServer singleton with a GLib main loop thread."""
         if self._rtsp_server is not None:
             return
+        with self._rtsp_lock:
+            if self._rtsp_server is None:
+                self._start_rtsp_server()
+
+    def _start_rtsp_server(self) -> None:
         if not _HAS_RTSP_SERVER:
             raise RuntimeError(
                 "GstRtspServer not installed (apt install gir1.2-gst-rtsp-server-1.0)"
@@ -192,11 +338,11 @@ class PreviewService:
         from gi.repository import Gst
         Gst.init(None)
 
-        self._rtsp_server = _GstRtspServer.RTSPServer()
-        self._rtsp_server.set_address(self.rtsp_bind_address)
-        self._rtsp_server.set_service(str(self.rtsp_port))
-        self._rtsp_mounts = self._rtsp_server.get_mount_points()
-        self._rtsp_server.attach(None)
+        server = _GstRtspServer.RTSPServer()
+        server.set_address(self.rtsp_bind_address)
+        server.set_service(str(self.rtsp_port))
+        self._rtsp_mounts = server.get_mount_points()
+        server.attach(None)
 
         # GstRtspServer needs a running GLib MainLoop to accept clients.
         self._rtsp_loop = _GLib.MainLoop()
@@ -204,6 +350,8 @@ class PreviewService:
             target=self._rtsp_loop.run, daemon=True, name="rtsp-glib-loop"
         )
         self._rtsp_loop_thread.start()
+        # Published last: _ensure_rtsp_server's unlocked fast path relies on it.
+        self._rtsp_server = server
         logger.info(
             "RTSP server started on %s:%d (GLib loop thread active)",
             self.rtsp_bind_address, self.rtsp_port,
@@ -222,7 +370,7 @@ class PreviewService:
 
         self._rtsp_mounts.add_factory(mount_path, factory)
         self.rtsp_mount_active[cam_id] = True
-        logger.info(
+        logger.debug(
             "RTSP mount added: rtsp://%s:%d%s",
             self.rtsp_bind_address, self.rtsp_port, mount_path,
         )
@@ -234,80 +382,122 @@ class PreviewService:
         mount_path = f"/cam{cam_id}"
         self._rtsp_mounts.remove_factory(mount_path)
         self.rtsp_mount_active[cam_id] = False
-        logger.info("RTSP mount removed: %s", mount_path)
+        logger.debug("RTSP mount removed: %s", mount_path)
 
     def get_status(self) -> Dict[str, Any]:
-        """Get current preview status."""
-        with self.state_lock:
-            cameras: Dict[str, Dict[str, Any]] = {}
+        """
+        Get current preview status.
+
+        Served from the published snapshot without taking state_lock, so
+        status polling never stalls behind pipeline transitions. A full
+        rebuild only happens after a lifecycle transition marked the snapshot
+        dirty; otherwise an expired snapshot just gets its uptimes refreshed.
+        While one reader refreshes, concurrent readers keep getting the
+        previous snapshot. The returned dict must not be mutated.
+        """
+        snapshot = self._status_snapshot
+        if (
+            snapshot is not None
+            and not self._status_dirty
+            and time.monotonic() - self._status_snapshot_at < STATUS_SNAPSHOT_TTL
+        ):
+            return snapshot
+
+        if not self._status_refresh_lock.acquire(blocking=snapshot is None):
+            return snapshot
+        try:
+            if self._status_dirty or self._status_snapshot is None:
+                return self._build_status_snapshot()
+            return self._refresh_status_uptime()
+        finally:
+            self._status_refresh_lock.release()
+
+    def _publish_status_snapshot(self) -> None:
+        """Rebuild the status snapshot after a lifecycle change."""
+        with self._status_refresh_lock:
+            self._build_status_snapshot()
+
+    def _invalidate_status_snapshot(self) -> None:
+        self._status_dirty = True
+
+    def _uptime(self, cam_id: int, now: float) -> float:
+        started_at = self._started_at[cam_id]
+        return now - started_at if started_at else 0.0
+
+    def _refresh_status_uptime(self) -> Dict[str, Any]:
+        snapshot = self._status_snapshot
+        now = time.monotonic()
+        cameras = {
+            key: {**cam_status, "uptime": self._uptime(cam_id, now)} if cam_status["active"] else cam_status
+            for cam_id, (key, cam_status) in zip(self.camera_ids, snapshot["cameras"].items())
+        }
+        refreshed = {**snapshot, "cameras": cameras}
+        self._status_snapshot = refreshed
+        self._status_snapshot_at = now
+        return refreshed
+
+    def _build_status_snapshot(self) -> Dict[str, Any]:
+        # Cleared first so a transition racing this rebuild re-marks it dirty.
+        self._status_dirty = False
+        now = time.monotonic()
+        cameras: Dict[str, Dict[str, Any]] = {}
+        any_active = False
+
+        for cam_id, (key, template) in zip(self.camera_ids, self._status_templates.items()):
+            info = self.gst_manager.get_pipeline_status(self._pipeline_names[cam_id])
+            state = info.state if info else None
+
+            # In relay/RTSP mode, active = mount exists (no GStreamerManager pipeline).
+            if self.relay_url and self.rtsp_mount_active[cam_id]:
+                active = True
+            else:
+                active = state == PipelineState.RUNNING
+            uptime = self._uptime(cam_id, now) if active else 0.0
+
+            transport = self.preview_transport[cam_id]
+            cam_status = template.copy()
+            cam_status["active"] = active
+            cam_status["state"] = state.value if state else "stopped"
+            cam_status["uptime"] = uptime
+            cam_status["transport"] = transport
+            cam_status["webrtc"] = {
+                "enabled": transport == WEBRTC,
+                "stream_kind": template["stream_kind"],
+            }
+            cameras[key] = cam_status
+            any_active = any_active or active
 
-            for cam_id in self.camera_ids:
-                pipeline_name = f"preview_cam{cam_id}"
-                info = self.gst_manager.get_pipeline_status(pipeline_name)
-
-                # In relay/RTSP mode, active = mount exists (no GStreamerManager pipeline).
-                if self.relay_url and self.rtsp_mount_active.get(cam_id, False):
-                    active = True
-                else:
-                    active = bool(info and info.state == PipelineState.RUNNING)
-                uptime = 0.0
-                if info and info.start_time:
-                    uptime = (datetime.utcnow() - info.start_time).total_seconds()
-
-                transport = self.preview_transport.get(cam_id, HLS)
-                stream_kind = f"main_cam{cam_id}"
-                cameras[f"camera_{cam_id}"] = {
-                    "active": active,
-                    "state": info.state.value if info else "stopped",
-                    "uptime": uptime,
-                    # Backward-compatible field retained in dual-stack mode.
-                    "hls_url": f"/hls/cam{cam_id}.m3u8",
-                    "transport": transport,
-                    "stream_kind": stream_kind,
-                    "webrtc": {
-                        "enabled": transport == WEBRTC,
-                        "stream_kind": stream_kind,
-                    },
-                }
-                self.preview_active[cam_id] = active
+        active_webrtc_streams = list(self._active_sessions_view.values())
 
-            active_webrtc_streams = [
-                {
-                    "session_id": sid,
-                    "stream_kind": meta.get("stream_kind"),
-                    "camera_id": meta.get("camera_id"),
-                    "connection_id": meta.get("connection_id"),
-                }
-                for sid, meta in self.webrtc_sessions.items()
-                if meta.get("active")
-            ]
-
-            relay = None
-            if self.relay_url:
-                rtsp_urls = {}
-                mounts = {}
-                for cam_id in self.camera_ids:
-                    key = f"camera_{cam_id}"
-                    rtsp_urls[key] = f"rtsp://{self.rtsp_bind_address}:{self.rtsp_port}/cam{cam_id}"
-                    mounts[key] = self.rtsp_mount_active.get(cam_id, False)
-                relay = {
-                    "enabled": True,
-                    "ws_url": self.relay_url,
-                    "ingest": "rtsp",
-                    "rtsp_urls": rtsp_urls,
-                    "mounts": mounts,
-                }
-
-            return {
-                "preview_active": any(cam["active"] for cam in cameras.values()),
-                "cameras": cameras,
-                "transport_mode": self.preview_transport_mode,
-                "webrtc_supported": self._is_webrtc_supported(),
-                "ice_servers": self.get_ice_servers(),
-                "webrtc_streams": active_webrtc_streams,
-                "relay": relay,
+        relay = None
+        if self.relay_url:
+            rtsp_urls = {}
+            mounts = {}
+            for cam_id in self.camera_ids:
+                key = f"camera_{cam_id}"
+                rtsp_urls[key] = f"rtsp://{self.rtsp_bind_address}:{self.rtsp_port}/cam{cam_id}"
+                mounts[key] = self.rtsp_mount_active[cam_id]
+            relay = {
+                "enabled": True,
+                "ws_url": self.relay_url,
+                "ingest": "rtsp",
+                "rtsp_urls": rtsp_urls,
+                "mounts": mounts,
             }
 
+        snapshot = {
+            "preview_active": any_active,
+            "cameras": cameras,
+            "transport_mode": self.preview_transport_mode,
+            "webrtc_supported": self._is_webrtc_supported(),
+            "ice_servers": self.get_ice_servers(),
+            "webrtc_streams": active_webrtc_streams,
+            "relay": relay,
+        }
+        self._status_snapshot = snapshot
+        self._status_snapshot_at = now
+        return snapshot
+
     # ---------------------------------------------------------------------
     # Preview lifecycle
     # ---------------------------------------------------------------------
@@ -323,8 +513,214 @@ class PreviewService:
                 turn_server=self.turn_server,
             )
 
-        hls_location = str(self.hls_base_dir / f"cam{cam_id}.m3u8")
-        return pipeline_builders.build_preview_pipeline(cam_id, hls_location)
+        if self.hls_sink_mode == "memory":
+            return pipeline_builders.build_preview_memory_hls_pipeline(cam_id)
+
+        return pipeline_builders.build_preview_pipeline(cam_id, self._hls_paths[cam_id])
+
+    def _ensure_hls_base_dir(self) -> None:
+        """Recreate the HLS output dir if it is gone (tmpfs may be wiped)."""
+        try:
+            st = os.stat(self._hls_base_dir_str)
+            if not stat.S_ISDIR(st.st_mode):
+                os.makedirs(self._hls_base_dir_str, exist_ok=True)
+        except FileNotFoundError:
+            os.makedirs(self._hls_base_dir_str, exist_ok=True)
+
+    def _hls_url(self, cam_id: int) -> str:
+        if self.hls_sink_mode == "memory":
+            return f"/api/v1/preview/hls/cam{cam_id}.m3u8"
+        return f"/hls/cam{cam_id}.m3u8"
+
+    # ---------------------------------------------------------------------
+    # In-memory HLS
+    # ---------------------------------------------------------------------
+
+    def _attach_hls_ring(self, pipeline_name: str, cam_id: int) -> None:
+        """Feed the pipeline's `hlssink` appsink into the camera's segment ring."""
+        appsink = self._get_pipeline_element(pipeline_name, "hlssink")
+        if appsink is None:
+            raise RuntimeError(f"hlssink not found in {pipeline_name}")
+
+        from gi.repository import Gst
+
+        ring = self.hls_rings[cam_id]
+        ring.reset()
+
+        def on_new_sample(sink):
+            sample = sink.emit("pull-sample")
+            if sample is None:
+                return Gst.FlowReturn.EOS
+            buffer = sample.get_buffer()
+            ok, map_info = buffer.map(Gst.MapFlags.READ)
+            if not ok:
+                return Gst.FlowReturn.OK
+            try:
+                ring.push(bytes(map_info.data), keyframe=not buffer.has_flags(Gst.BufferFlags.DELTA_UNIT))
+            finally:
+                buffer.unmap(map_info)
+            return Gst.FlowReturn.OK
+
+        appsink.connect("new-sample", on_new_sample)
+
+    def get_hls_playlist(self, cam_id: int) -> Optional[bytes]:
+        ring = self.hls_rings.get(cam_id)
+        return ring.playlist() if ring else None
+
+    def get_hls_segment(self, cam_id: int, sequence: int) -> Optional[bytes]:
+        ring = self.hls_rings.get(cam_id)
+        return ring.segment(sequence) if ring else None
+
+    def get_latest_hls_segment(self, cam_id: int) -> Optional[bytes]:
+        ring = self.hls_rings.get(cam_id)
+        return ring.latest_segment() if ring else None
+
+    def _on_pipeline_eos(self, name: str, metadata: Dict[str, Any]) -> None:
+        logger.info("Preview pipeline %s received EOS", name)
+        self._mark_pipeline_ended(name, metadata)
+
+    def _on_pipeline_error(self, name: str, error: str, debug: Any, metadata: Dict[str, Any]) -> None:
+        logger.error("Preview pipeline %s error: %s, debug: %s", name, error, debug)
+        self._mark_pipeline_ended(name, metadata)
+
+    def _mark_pipeline_ended(self, name: str, metadata: Dict[str, Any]) -> None:
+        """Clear preview_active for a camera whose pipeline died on its own."""
+        cam_id = metadata.get("camera_id")
+        # Runs on the GStreamer bus thread: never block on the camera lock.
+        # A start/stop holding it sets preview_active itself.
+        if cam_id in self._camera_id_set and self._camera_locks[cam_id].acquire(blocking=False):
+            try:
+                info = self.gst_manager.get_pipeline_status(name)
+                if not info or info.state != PipelineState.RUNNING:
+                    self.preview_active[cam_id] = False
+                    self._started_at[cam_id] = 0.0
+            finally:
+                self._camera_locks[cam_id].release()
+        self._invalidate_status_snapshot()
+
+    def _build_pipelines(self, cameras: list, transport: Transport) -> Dict[int, str]:
+        """
+        Build pipeline descriptions for the given cameras.
+
+        Pure string/config work, done before any camera lock is taken.
+        Cameras whose description fails to build are left out and fail
+        in _start_camera.
+        """
+        if transport == WEBRTC and self.relay_url:
+            # Relay mode mounts RTSP factories; no preview pipeline is built.
+            return {}
+
+        descriptions: Dict[int, str] = {}
+        for cam_id in cameras:
+            if cam_id not in self._camera_id_set:
+                continue
+            try:
+                descriptions[cam_id] = self._build_pipeline(cam_id, transport)
+            except Exception as e:
+                logger.error("Failed to build preview pipeline for camera %s: %s", cam_id, e)
+        return descriptions
+
+    def _start_camera(self, cam_id: int, transport: Transport, pipeline_str: Optional[str]) -> bool:
+        """Start (or keep) one camera's preview pipeline on the given transport."""
+        with self._camera_locks[cam_id]:
+            return self._start_camera_locked(cam_id, transport, pipeline_str)
+
+    def _start_camera_locked(self, cam_id: int, transport: Transport, pipeline_str: Optional[str]) -> bool:
+        """Caller holds the camera lock."""
+        pipeline_name = self._pipeline_names[cam_id]
+        # The sensor is only free once a previous async teardown settles.
+        self._wait_for_camera_teardown(cam_id, timeout=2.0)
+        # Keeps a pipeline already running on this transport. A stale
+        # (stopped/errored) one, or one running on the other transport, is
+        # set to NULL and dropped in the same manager call.
+        prev_state = self.gst_manager.ensure_removed_unless_running(
+            pipeline_name,
+            keep_running=self.preview_transport[cam_id] == transport,
+        )
+        if prev_state == PipelineState.RUNNING:
+            return True
+        self.webrtc_callbacks_registered.discard(pipeline_name)
+
+        try:
+            # Relay mode: use RTSP ingest instead of webrtcbin.
+            # UI-facing transport stays "webrtc".
+            if transport == WEBRTC and self.relay_url:
+                self._add_rtsp_mount(cam_id)
+                self.preview_active[cam_id] = True
+                self._started_at[cam_id] = time.monotonic()
+                self.preview_transport[cam_id] = WEBRTC  # UI sees "webrtc"
+                logger.debug("Preview camera %s started (rtsp ingest for relay)", cam_id)
+                return True
+
+            if pipeline_str is None:
+                return False
+
+            created = self.gst_manager.create_pipeline(
+                name=pipeline_name,
+                pipeline_description=pipeline_str,
+                on_eos=self._on_pipeline_eos,
+                on_error=self._on_pipeline_error,
+                metadata={
+                    "camera_id": cam_id,
+                    "transport": transport,
+                },
+            )
+            if not created:
+                return False
+
+            if transport == HLS and self.hls_sink_mode == "memory":
+                self._attach_hls_ring(pipeline_name, cam_id)
+
+            # GStreamer 1.20's webrtcbin `turn-server` property validates
+            # the URL but doesn't register it with the ICE agent for relay
+            # allocation.  The `add-turn-server` action signal is the
+            # correct API and actually adds it to the relay list.
+            if transport == WEBRTC and self.turn_server:
+                webrtcbin = self._get_webrtcbin(pipeline_name)
+                if webrtcbin:
+                    added = webrtcbin.emit("add-turn-server", self.turn_server)
+                    logger.debug("TURN server added to %s via signal: %s", pipeline_name, added)
+
+            if not self.gst_manager.start_pipeline(pipeline_name):
+                self.gst_manager.remove_pipeline(pipeline_name)
+                return False
+
+            self.preview_active[cam_id] = True
+            self.preview_transport[cam_id] = transport
+            self._started_at[cam_id] = time.monotonic()
+            logger.debug("Preview camera %s started (%s)", cam_id, transport)
+            return True
+        except Exception as e:
+            logger.error("Failed to start preview camera %s: %s", cam_id, e)
+            return False
+
+    def _start_result(self, started_cameras: list, failed_cameras: list, transport: Transport) -> Dict[str, Any]:
+        if not started_cameras:
+            return {
+                "success": False,
+                "message": "Failed to start any preview cameras",
+                "failed_cameras": failed_cameras,
+            }
+
+        self._start_exposure_sync()
+
+        return {
+            "success": True,
+            "message": f"Preview started for cameras: {started_cameras}",
+            "transport": transport,
+            "cameras_started": started_cameras,
+            "cameras_failed": failed_cameras,
+        }
+
+    def _cameras_running_in_snapshot(self, cameras: list, transport: Transport) -> bool:
+        snapshot = self._status_snapshot
+        if snapshot is None or self._status_dirty:
+            return False
+        for cam_id in cameras:
+            cam = snapshot["cameras"].get(f"camera_{cam_id}")
+            if not cam or not cam["active"] or cam["transport"] != transport:
+                return False
+        return True
 
     def start_preview(self, camera_id: Optional[int] = None, transport: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -334,190 +730,277 @@ class PreviewService:
             camera_id: Specific camera to start (0 or 1), or None for both.
             transport: Optional transport override (hls|webrtc).
         """
-        with self.state_lock:
-            resolved_transport = self._resolve_transport(transport)
-            cameras_to_start = [camera_id] if camera_id is not None else self.camera_ids
-
-            # Recreate HLS dir for legacy transport.
-            if resolved_transport == HLS:
-                self.hls_base_dir.mkdir(parents=True, exist_ok=True)
-
-            started_cameras = []
-            failed_cameras = []
-
-            for cam_id in cameras_to_start:
-                if cam_id not in self.camera_ids:
-                    failed_cameras.append(cam_id)
-                    continue
-
-                pipeline_name = f"preview_cam{cam_id}"
-                status = self.gst_manager.get_pipeline_status(pipeline_name)
-
-                if status and status.state == PipelineState.RUNNING:
-                    # If already running but with different transport, restart.
-                    active_transport = self.preview_transport.get(cam_id, HLS)
-                    if active_transport != resolved_transport:
-                        self.gst_manager.stop_pipeline(pipeline_name, wait_for_eos=False, timeout=1.0)
-                        self.gst_manager.remove_pipeline(pipeline_name)
-                        self.webrtc_callbacks_registered.discard(pipeline_name)
-                    else:
-                        started_cameras.append(cam_id)
-                        continue
+        resolved_transport = self._resolve_transport(transport)
+        cameras_to_start = [camera_id] if camera_id is not None else self.camera_ids
 
-                if status:
-                    self.gst_manager.remove_pipeline(pipeline_name)
-                    self.webrtc_callbacks_registered.discard(pipeline_name)
+        # Fast path: a fresh snapshot already shows every requested camera
+        # running on this transport (e.g. a UI refresh), so skip GStreamer.
+        if self._cameras_running_in_snapshot(cameras_to_start, resolved_transport):
+            return self._start_result(list(cameras_to_start), [], resolved_transport)
 
-                try:
-                    # Relay mode: use RTSP ingest instead of webrtcbin.
-                    # UI-facing transport stays "webrtc".
-                    if resolved_transport == WEBRTC and self.relay_url:
-                        self._add_rtsp_mount(cam_id)
-                        self.preview_active[cam_id] = True
-                        self.preview_transport[cam_id] = WEBRTC  # UI sees "webrtc"
-                        started_cameras.append(cam_id)
-                        logger.info("Preview camera %s started (rtsp ingest for relay)", cam_id)
-                        continue
+        # Recreate HLS dir for legacy transport.
+        if resolved_transport == HLS and self.hls_sink_mode == "file":
+            self._ensure_hls_base_dir()
 
-                    pipeline_str = self._build_pipeline(cam_id, resolved_transport)
+        descriptions = self._build_pipelines(cameras_to_start, resolved_transport)
 
-                    def on_eos(name, metadata):
-                        logger.info("Preview pipeline %s received EOS", name)
+        started_cameras = []
+        failed_cameras = []
 
-                    def on_error(name, error, debug, metadata):
-                        logger.error("Preview pipeline %s error: %s, debug: %s", name, error, debug)
+        for cam_id in cameras_to_start:
+            if cam_id not in self._camera_id_set:
+                failed_cameras.append(cam_id)
+                continue
+            if self._start_camera(cam_id, resolved_transport, descriptions.get(cam_id)):
+                started_cameras.append(cam_id)
+            else:
+                failed_cameras.append(cam_id)
 
-                    created = self.gst_manager.create_pipeline(
-                        name=pipeline_name,
-                        pipeline_description=pipeline_str,
-                        on_eos=on_eos,
-                        on_error=on_error,
-                        metadata={
-                            "camera_id": cam_id,
-                            "transport": resolved_transport,
-                        },
-                    )
-                    if not created:
-                        failed_cameras.append(cam_id)
-                        continue
-
-                    # GStreamer 1.20's webrtcbin `turn-server` property validates
-                    # the URL but doesn't register it with the ICE agent for relay
-                    # allocation.  The `add-turn-server` action signal is the
-                    # correct API and actually adds it to the relay list.
-                    if resolved_transport == WEBRTC and self.turn_server:
-                        webrtcbin = self._get_webrtcbin(pipeline_name)
-                        if webrtcbin:
-                            added = webrtcbin.emit("add-turn-server", self.turn_server)
-                            logger.info("TURN server added to %s via signal: %s", pipeline_name, added)
-
-                    if not self.gst_manager.start_pipeline(pipeline_name):
-                        self.gst_manager.remove_pipeline(pipeline_name)
-                        failed_cameras.append(cam_id)
-                        continue
+        self._publish_status_snapshot()
+        logger.info(
+            "Preview start (%s): started=%s failed=%s",
+            resolved_transport, started_cameras, failed_cameras,
+        )
+        return self._start_result(started_cameras, failed_cameras, resolved_transport)
 
-                    self.preview_active[cam_id] = True
-                    self.preview_transport[cam_id] = resolved_transport
-                    started_cameras.append(cam_id)
-                    logger.info("Preview camera %s started (%s)", cam_id, resolved_transport)
-                except Exception as e:
-                    logger.error("Failed to start preview camera %s: %s", cam_id, e)
-                    failed_cameras.append(cam_id)
-
-            if not started_cameras:
-                return {
-                    "success": False,
-                    "message": "Failed to start any preview cameras",
-                    "failed_cameras": failed_cameras,
-                }
+    def _clear_camera_sessions(self, cam_id: int) -> None:
+        with self.state_lock:
+            to_remove = self.sessions_by_camera[cam_id]
+            self.sessions_by_camera[cam_id] = set()
+            for sid in to_remove:
+                meta = self.webrtc_sessions.pop(sid, {})
+                self._active_sessions_view.pop(sid, None)
+                conn = meta.get("connection_id")
+                if conn and conn in self.connection_sessions:
+                    self.connection_sessions[conn].discard(sid)
+                    if not self.connection_sessions[conn]:
+                        del self.connection_sessions[conn]
+            self._invalidate_status_snapshot()
+
+    def _stop_camera(self, cam_id: int) -> bool:
+        """Stop one camera's preview pipeline (or RTSP mount in relay mode)."""
+        with self._camera_locks[cam_id]:
+            return self._stop_camera_locked(cam_id)
+
+    def _stop_camera_locked(self, cam_id: int) -> bool:
+        """Caller holds the camera lock."""
+        pipeline_name = self._pipeline_names[cam_id]
+        try:
+            # Relay mode: remove RTSP mount instead of stopping GStreamer pipeline.
+            if self.rtsp_mount_active[cam_id]:
+                self._remove_rtsp_mount(cam_id)
+                self._clear_camera_sessions(cam_id)
+                self.preview_active[cam_id] = False
+                self._started_at[cam_id] = 0.0
+                return True
+
+            # Fire-and-forget teardown: the NULL transition completes in
+            # the background and failures are logged from its callback.
+            teardown_done = threading.Event()
+            stopped = self.gst_manager.stop_pipeline_async(
+                pipeline_name,
+                on_complete=lambda name, success: self._on_teardown_complete(name, success, teardown_done),
+            )
+            if not stopped:
+                return False
+            self._pending_teardown[cam_id] = teardown_done
+
+            self.preview_active[cam_id] = False
+            self.preview_transport[cam_id] = HLS
+            self._started_at[cam_id] = 0.0
+            self.webrtc_callbacks_registered.discard(pipeline_name)
+            self._clear_camera_sessions(cam_id)
+            return True
+        except Exception as e:
+            logger.error("Failed to stop preview camera %s: %s", cam_id, e)
+            return False
 
-            # Exposure sync is only useful for long-lived preview pipelines.
-            exposure_service = get_exposure_sync_service(self.gst_manager)
-            if exposure_service:
-                exposure_service.start()
+    def _on_teardown_complete(self, name: str, success: bool, done: threading.Event) -> None:
+        if not success:
+            logger.error("Preview pipeline %s failed to reach NULL state during teardown", name)
+        # The snapshot still reports "stopping"; mark it dirty before waking
+        # wait_for_teardown() callers so their next status read is current.
+        self._invalidate_status_snapshot()
+        done.set()
+
+    def _wait_for_camera_teardown(self, cam_id: int, timeout: float) -> bool:
+        pending = self._pending_teardown.get(cam_id)
+        if pending is None:
+            return True
+        if not pending.wait(timeout):
+            logger.warning("Preview camera %s teardown still pending after %.1fs", cam_id, timeout)
+            return False
+        if self._pending_teardown.get(cam_id) is pending:
+            del self._pending_teardown[cam_id]
+        return True
+
+    def wait_for_teardown(self, timeout: float = 2.0) -> bool:
+        """Block until pending preview teardowns release the cameras."""
+        deadline = time.monotonic() + timeout
+        settled = True
+        for cam_id in self.camera_ids:
+            remaining = max(0.0, deadline - time.monotonic())
+            settled = self._wait_for_camera_teardown(cam_id, remaining) and settled
+        return settled
 
+    @staticmethod
+    def _stop_result(stopped_cameras: list, failed_cameras: list) -> Dict[str, Any]:
+        if not stopped_cameras:
             return {
-                "success": True,
-                "message": f"Preview started for cameras: {started_cameras}",
-                "transport": resolved_transport,
-                "cameras_started": started_cameras,
-                "cameras_failed": failed_cameras,
+                "success": False,
+                "message": "No preview cameras were stopped",
+                "failed_cameras": failed_cameras,
             }
 
-    def _clear_camera_sessions(self, cam_id: int) -> None:
-        to_remove = [sid for sid, meta in self.webrtc_sessions.items() if meta.get("camera_id") == cam_id]
-        for sid in to_remove:
-            meta = self.webrtc_sessions.pop(sid, {})
-            conn = meta.get("connection_id")
-            if conn and conn in self.connection_sessions:
-                self.connection_sessions[conn].discard(sid)
-                if not self.connection_sessions[conn]:
-                    del self.connection_sessions[conn]
+        return {
+            "success": True,
+            "message": f"Preview stopped for cameras: {stopped_cameras}",
+            "cameras_stopped": stopped_cameras,
+            "cameras_failed": failed_cameras,
+        }
 
-    def stop_preview(self, camera_id: Optional[int] = None) -> Dict[str, Any]:
-        """Stop preview for one or both cameras."""
-        with self.state_lock:
-            cameras_to_stop = [camera_id] if camera_id is not None else self.camera_ids
+    def _start_exposure_sync(self) -> None:
+        # Exposure sync is only useful for long-lived preview pipelines.
+        if self._exposure_started:
+            return
+        with self._exposure_lock:
+            if self._exposure_started:
+                return
+            exposure_service = get_exposure_sync_service(self.gst_manager)
+            if exposure_service:
+                if self.hls_sink_mode == "memory":
+                    # No segments on disk: brightness analysis reads the rings.
+                    exposure_service.segment_source = self.get_latest_hls_segment
+                exposure_service.start()
+                self._exposure_started = True
 
-            stop_exposure_sync = camera_id is None
-            if stop_exposure_sync:
+    def _stop_exposure_sync(self, camera_id: Optional[int]) -> None:
+        # Exposure sync drives both cameras, so only a full stop tears it down.
+        if camera_id is None:
+            with self._exposure_lock:
                 exposure_service = get_exposure_sync_service()
                 if exposure_service:
                     exposure_service.stop()
+                self._exposure_started = False
 
-            stopped_cameras = []
-            failed_cameras = []
-
-            for cam_id in cameras_to_stop:
-                if cam_id not in self.camera_ids:
-                    failed_cameras.append(cam_id)
-                    continue
+    def stop_preview(self, camera_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Stop preview for one or both cameras.
 
-                pipeline_name = f"preview_cam{cam_id}"
-                try:
-                    # Relay mode: remove RTSP mount instead of stopping GStreamer pipeline.
-                    if self.rtsp_mount_active.get(cam_id, False):
-                        self._remove_rtsp_mount(cam_id)
-                        self._clear_camera_sessions(cam_id)
-                        self.preview_active[cam_id] = False
-                        stopped_cameras.append(cam_id)
-                        continue
+        Pipeline teardown is asynchronous: cameras are reported stopped as soon
+        as their teardown is dispatched. Callers that need the sensors released
+        (e.g. before recording) should follow up with wait_for_teardown().
+        """
+        cameras_to_stop = [camera_id] if camera_id is not None else self.camera_ids
+        self._stop_exposure_sync(camera_id)
+
+        stopped_cameras = []
+        failed_cameras = []
+
+        for cam_id in cameras_to_stop:
+            if cam_id not in self._camera_id_set:
+                failed_cameras.append(cam_id)
+                continue
+            if self._stop_camera(cam_id):
+                stopped_cameras.append(cam_id)
+            else:
+                failed_cameras.append(cam_id)
+
+        self._publish_status_snapshot()
+        logger.info("Preview stop: stopped=%s failed=%s", stopped_cameras, failed_cameras)
+        return self._stop_result(stopped_cameras, failed_cameras)
+
+    def _restart_camera(self, cam_id: int, transport: Transport, pipeline_str: Optional[str]) -> tuple[bool, bool]:
+        # One lock hold for stop + start so nothing can slip in between.
+        with self._camera_locks[cam_id]:
+            stopped = self._stop_camera_locked(cam_id)
+            return stopped, self._start_camera_locked(cam_id, transport, pipeline_str)
 
-                    stopped = self.gst_manager.stop_pipeline(
-                        pipeline_name,
-                        wait_for_eos=False,
-                        timeout=1.0,
-                    )
-                    if not stopped:
-                        failed_cameras.append(cam_id)
-                        continue
+    def restart_preview(self, camera_id: Optional[int] = None, transport: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Restart preview for one or both cameras.
 
-                    self.preview_active[cam_id] = False
-                    self.preview_transport[cam_id] = HLS
-                    self.webrtc_callbacks_registered.discard(pipeline_name)
-                    self._clear_camera_sessions(cam_id)
-                    stopped_cameras.append(cam_id)
-                except Exception as e:
-                    logger.error("Failed to stop preview camera %s: %s", cam_id, e)
-                    failed_cameras.append(cam_id)
-
-            if not stopped_cameras:
-                return {
-                    "success": False,
-                    "message": "No preview cameras were stopped",
-                    "failed_cameras": failed_cameras,
+        An uncontended call runs its round immediately. Calls arriving while a
+        round is in flight (button mashing, watchdog and UI firing together)
+        are queued and merged into one follow-up round per transport, over the
+        union of their cameras; each caller gets the result of the round that
+        ran its own transport.
+        """
+        resolved_transport = self._resolve_transport(transport)
+        cameras = [camera_id] if camera_id is not None else self.camera_ids
+
+        with self._restart_lock:
+            batch = self._restart_queue.get(resolved_transport)
+            if batch is None:
+                batch = self._restart_queue[resolved_transport] = {
+                    "cameras": set(),
+                    "done": threading.Event(),
+                    "result": None,
                 }
+            batch["cameras"].update(cameras)
+            run_rounds = not self._restart_running
+            self._restart_running = True
+
+        if run_rounds:
+            self._drain_restarts()
+        batch["done"].wait()
+        return batch["result"]
+
+    def _drain_restarts(self) -> None:
+        """Run queued restart rounds until none are left (one runner at a time)."""
+        while True:
+            with self._restart_lock:
+                if not self._restart_queue:
+                    self._restart_running = False
+                    return
+                transport = next(iter(self._restart_queue))
+                batch = self._restart_queue.pop(transport)
+
+            pending = batch["cameras"]
+            cameras = [cam_id for cam_id in self.camera_ids if cam_id in pending]
+            cameras += [cam_id for cam_id in pending if cam_id not in self._camera_id_set]
+            try:
+                batch["result"] = self._restart_cameras(cameras, transport)
+            except Exception as e:
+                logger.error("Preview restart failed: %s", e)
+                batch["result"] = {"success": False, "message": f"Restart failed: {e}"}
+            finally:
+                batch["done"].set()
 
-            return {
-                "success": True,
-                "message": f"Preview stopped for cameras: {stopped_cameras}",
-                "cameras_stopped": stopped_cameras,
-                "cameras_failed": failed_cameras,
-            }
+    def _restart_cameras(self, cameras: list[int], resolved_transport: Transport) -> Dict[str, Any]:
+        """
+        Run one restart round.
 
-    def restart_preview(self, camera_id: Optional[int] = None, transport: Optional[str] = None) -> Dict[str, Any]:
-        stop_result = self.stop_preview(camera_id)
-        start_result = self.start_preview(camera_id, transport=transport)
+        Each camera is stopped and restarted on its own executor worker, so a
+        camera's start fires as soon as its own stop completes and the two
+        cameras never wait on each other's teardown.
+        """
+        full_restart = self._camera_id_set.issubset(cameras)
+        self._stop_exposure_sync(None if full_restart else cameras[0])
+
+        if resolved_transport == HLS and self.hls_sink_mode == "file":
+            self._ensure_hls_base_dir()
+
+        descriptions = self._build_pipelines(cameras, resolved_transport)
+        futures = {
+            cam_id: self._executor.submit(
+                self._restart_camera, cam_id, resolved_transport, descriptions.get(cam_id)
+            )
+            for cam_id in cameras
+            if cam_id in self._camera_id_set
+        }
+
+        stopped_cameras, stop_failed = [], []
+        started_cameras, start_failed = [], []
+        for cam_id in cameras:
+            future = futures.get(cam_id)
+            stopped, started = future.result() if future else (False, False)
+            (stopped_cameras if stopped else stop_failed).append(cam_id)
+            (started_cameras if started else start_failed).append(cam_id)
+
+        self._publish_status_snapshot()
+        stop_result = self._stop_result(stopped_cameras, stop_failed)
+        start_result = self._start_result(started_cameras, start_failed, resolved_transport)
         return {
             "success": start_result["success"],
             "message": f"Restart: {stop_result['message']} -> {start_result['message']}",
@@ -540,7 +1023,7 @@ class PreviewService:
         except Exception as e:
             logger.error("Failed to emit WebRTC message: %s", e)
 
-    def _get_webrtcbin(self, pipeline_name: str):
+    def _get_pipeline_element(self, pipeline_name: str, element_name: str):
         with self.gst_manager.pipelines_lock:
             entry = self.gst_manager.pipelines.get(pipeline_name)
             if not entry:
@@ -548,7 +1031,10 @@ class PreviewService:
             pipeline = entry.get("pipeline")
             if pipeline is None:
                 return None
-            return pipeline.get_by_name("webrtc")
+            return pipeline.get_by_name(element_name)
+
+    def _get_webrtcbin(self, pipeline_name: str):
+        return self._get_pipeline_element(pipeline_name, "webrtc")
 
     def _register_webrtc_callbacks(self, pipeline_name: str) -> None:
         if pipeline_name in self.webrtc_callbacks_registered:
@@ -559,27 +1045,46 @@ class PreviewService:
             raise RuntimeError(f"webrtcbin not found in {pipeline_name}")
 
         def on_ice_candidate(_element, mlineindex, candidate):
-            # Emit candidate for every active session attached to this pipeline.
-            for sid, meta in list(self.webrtc_sessions.items()):
-                if meta.get("pipeline_name") != pipeline_name or not meta.get("active"):
-                    continue
-                self._emit_webrtc(
-                    meta["connection_id"],
-                    {
-                        "v": 1,
-                        "type": "webrtc_ice_candidate",
-                        "data": {
-                            "session_id": sid,
-                            "stream_kind": meta.get("stream_kind"),
-                            "candidate": candidate,
-                            "sdpMLineIndex": mlineindex,
-                        },
-                    },
-                )
+            # Queue candidate for every active session attached to this pipeline.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Local ICE candidate on %s (mline %s): %s", pipeline_name, mlineindex, candidate)
+            entry = {"candidate": candidate, "sdpMLineIndex": mlineindex}
+            with self._ice_batch_lock:
+                for sid, meta in list(self.webrtc_sessions.items()):
+                    if meta.get("pipeline_name") != pipeline_name or not meta.get("active"):
+                        continue
+                    self._ice_batch.setdefault(sid, []).append(entry)
+                if self._ice_batch and self._ice_batch_timer is None:
+                    self._ice_batch_timer = threading.Timer(ICE_BATCH_INTERVAL, self._flush_ice_batch)
+                    self._ice_batch_timer.daemon = True
+                    self._ice_batch_timer.start()
 
         webrtcbin.connect("on-ice-candidate", on_ice_candidate)
         self.webrtc_callbacks_registered.add(pipeline_name)
 
+    def _flush_ice_batch(self) -> None:
+        """Emit queued local ICE candidates, one message per session."""
+        with self._ice_batch_lock:
+            batch, self._ice_batch = self._ice_batch, {}
+            self._ice_batch_timer = None
+
+        for sid, candidates in batch.items():
+            meta = self.webrtc_sessions.get(sid)
+            if not meta:
+                continue
+            self._emit_webrtc(
+                meta["connection_id"],
+                {
+                    "v": 1,
+                    "type": "webrtc_ice_candidates",
+                    "data": {
+                        "session_id": sid,
+                        "stream_kind": meta.get("stream_kind"),
+                        "candidates": candidates,
+                    },
+                },
+            )
+
     def create_webrtc_session(self, connection_id: str, stream_kind: str) -> Dict[str, Any]:
         """
         Allocate/create a WebRTC session for a preview stream kind.
@@ -592,93 +1097,166 @@ class PreviewService:
             return {"success": False, "message": f"Unsupported stream_kind: {stream_kind}"}
 
         cam_id = 0 if stream_kind.endswith("0") else 1
-        should_start = False
-        with self.state_lock:
-            active_transport = self.preview_transport.get(cam_id, HLS)
-            active_state = self.preview_active.get(cam_id, False)
-            should_start = not active_state or active_transport != WEBRTC
+        pipeline_name = self._pipeline_names[cam_id]
+        started = False
+        pipeline_str = None
+        if not self._webrtc_running(cam_id):
+            pipeline_str = self._build_pipelines([cam_id], WEBRTC).get(cam_id)
+
+        # One camera-lock hold covers the running check, the start and the
+        # session registration, so the camera cannot be stopped in between.
+        with self._camera_locks[cam_id]:
+            if not self._webrtc_running(cam_id):
+                if pipeline_str is None:
+                    # Stopped between the unlocked check and taking the lock.
+                    pipeline_str = self._build_pipelines([cam_id], WEBRTC).get(cam_id)
+                if not self._start_camera_locked(cam_id, WEBRTC, pipeline_str):
+                    return {"success": False, "message": "Failed to start WebRTC preview"}
+                started = True
+
+            with self.state_lock:
+                session_id = secrets.token_hex(16)
+                self._register_webrtc_callbacks(pipeline_name)
+
+                self.webrtc_sessions[session_id] = {
+                    "session_id": session_id,
+                    "connection_id": connection_id,
+                    "camera_id": cam_id,
+                    "stream_kind": stream_kind,
+                    "pipeline_name": pipeline_name,
+                    "active": True,
+                    "created_at": time.monotonic(),
+                }
+                connection_sessions = self.connection_sessions.get(connection_id)
+                if connection_sessions is None:
+                    connection_sessions = self.connection_sessions[connection_id] = set()
+                connection_sessions.add(session_id)
+                self.sessions_by_camera[cam_id].add(session_id)
+                self._active_sessions_view[session_id] = {
+                    "session_id": session_id,
+                    "stream_kind": stream_kind,
+                    "camera_id": cam_id,
+                    "connection_id": connection_id,
+                }
+                self._invalidate_status_snapshot()
 
-        if should_start:
-            start = self.start_preview(camera_id=cam_id, transport=WEBRTC)
-            if not start.get("success"):
-                return {"success": False, "message": start.get("message", "Failed to start WebRTC preview")}
+        if started:
+            self._start_exposure_sync()
+            self._publish_status_snapshot()
 
-        with self.state_lock:
-            session_id = str(uuid.uuid4())
-            pipeline_name = f"preview_cam{cam_id}"
-            self._register_webrtc_callbacks(pipeline_name)
+        return {
+            "success": True,
+            "session_id": session_id,
+            "stream_kind": stream_kind,
+            "camera_id": cam_id,
+            "ice_servers": self.get_ice_servers(),
+        }
 
-            self.webrtc_sessions[session_id] = {
-                "session_id": session_id,
-                "connection_id": connection_id,
-                "camera_id": cam_id,
-                "stream_kind": stream_kind,
-                "pipeline_name": pipeline_name,
-                "active": True,
-                "created_at": time.time(),
-            }
-            self.connection_sessions.setdefault(connection_id, set()).add(session_id)
+    def prewarm_webrtc(self, cam_id: int) -> bool:
+        """Start a camera's WebRTC pipeline and ICE callbacks with no session attached."""
+        pipeline_str = None
+        if not self._webrtc_running(cam_id):
+            pipeline_str = self._build_pipelines([cam_id], WEBRTC).get(cam_id)
+
+        with self._camera_locks[cam_id]:
+            if not self._webrtc_running(cam_id):
+                if pipeline_str is None:
+                    pipeline_str = self._build_pipelines([cam_id], WEBRTC).get(cam_id)
+                if not self._start_camera_locked(cam_id, WEBRTC, pipeline_str):
+                    logger.warning("WebRTC prewarm failed for camera %s", cam_id)
+                    return False
+            self._register_webrtc_callbacks(self._pipeline_names[cam_id])
+
+        self._publish_status_snapshot()
+        logger.info("WebRTC pipeline prewarmed for camera %s", cam_id)
+        return True
+
+    def _prewarm_all_webrtc(self) -> None:
+        for cam_id in self.camera_ids:
+            try:
+                self.prewarm_webrtc(cam_id)
+            except Exception as e:
+                logger.error("WebRTC prewarm failed for camera %s: %s", cam_id, e)
 
-            return {
-                "success": True,
-                "session_id": session_id,
-                "stream_kind": stream_kind,
-                "camera_id": cam_id,
-                "ice_servers": self.get_ice_servers(),
-            }
+    def _webrtc_running(self, cam_id: int) -> bool:
+        return self.preview_active[cam_id] and self.preview_transport[cam_id] == WEBRTC
 
     def _parse_offer(self, sdp_offer: str):
-        import gi
-        gi.require_version("GstWebRTC", "1.0")
-        gi.require_version("GstSdp", "1.0")
-        from gi.repository import GstWebRTC, GstSdp
+        _, sdpmsg = _GstSdp.SDPMessage.new()
+        _GstSdp.sdp_message_parse_buffer(bytes(sdp_offer.encode("utf-8")), sdpmsg)
+        return _GstWebRTC.WebRTCSessionDescription.new(_GstWebRTC.WebRTCSDPType.OFFER, sdpmsg)
 
-        _, sdpmsg = GstSdp.SDPMessage.new()
-        GstSdp.sdp_message_parse_buffer(bytes(sdp_offer.encode("utf-8")), sdpmsg)
-        return GstWebRTC.WebRTCSessionDescription.new(GstWebRTC.WebRTCSDPType.OFFER, sdpmsg)
-
-    def handle_webrtc_offer(self, connection_id: str, session_id: str, sdp_offer: str) -> Dict[str, Any]:
+    def _lookup_session(self, connection_id: str, session_id: str) -> tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Validate session ownership; returns (session, error_message)."""
         with self.state_lock:
             session = self.webrtc_sessions.get(session_id)
             if not session:
-                return {"success": False, "message": "Unknown session_id"}
+                return None, "Unknown session_id"
             if session.get("connection_id") != connection_id:
-                return {"success": False, "message": "Session does not belong to this connection"}
+                return None, "Session does not belong to this connection"
+            return session, None
 
-            pipeline_name = session["pipeline_name"]
-            webrtcbin = self._get_webrtcbin(pipeline_name)
-            if webrtcbin is None:
-                return {"success": False, "message": "webrtcbin not found"}
+    def handle_webrtc_offer(self, connection_id: str, session_id: str, sdp_offer: str) -> Dict[str, Any]:
+        """
+        Apply a browser offer and start answer generation.
 
-            try:
-                offer = self._parse_offer(sdp_offer)
-                import gi
-                gi.require_version("Gst", "1.0")
-                from gi.repository import Gst
-
-                set_remote = Gst.Promise.new()
-                webrtcbin.emit("set-remote-description", offer, set_remote)
-                set_remote.interrupt()
-
-                create_answer = Gst.Promise.new()
-                webrtcbin.emit("create-answer", None, create_answer)
-                create_answer.wait()
-                reply = create_answer.get_reply()
-                answer = reply.get_value("answer")
-
-                set_local = Gst.Promise.new()
-                webrtcbin.emit("set-local-description", answer, set_local)
-                set_local.interrupt()
-
-                return {
-                    "success": True,
-                    "session_id": session_id,
-                    "stream_kind": session.get("stream_kind"),
-                    "sdp": answer.sdp.as_text(),
-                }
-            except Exception as e:
-                logger.error("Failed handling WebRTC offer: %s", e)
-                return {"success": False, "message": str(e)}
+        The answer is produced by a promise callback on the GStreamer thread
+        and pushed to the connection as `webrtc_answer` through the emitter,
+        so this returns `pending` as soon as create-answer is dispatched.
+        state_lock only covers the session lookup.
+        """
+        session, error = self._lookup_session(connection_id, session_id)
+        if session is None:
+            return {"success": False, "message": error}
+
+        webrtcbin = self._get_webrtcbin(session["pipeline_name"])
+        if webrtcbin is None:
+            return {"success": False, "message": "webrtcbin not found"}
+
+        stream_kind = session.get("stream_kind")
+        try:
+            offer = self._parse_offer(sdp_offer)
+
+            set_remote = _Gst.Promise.new()
+            webrtcbin.emit("set-remote-description", offer, set_remote)
+            set_remote.interrupt()
+
+            def on_answer_created(promise, _user_data):
+                try:
+                    reply = promise.get_reply()
+                    answer = reply.get_value("answer") if reply else None
+                    if answer is None:
+                        raise RuntimeError("webrtcbin did not produce an answer")
+                    webrtcbin.emit("set-local-description", answer, _Gst.Promise.new())
+                    message = {
+                        "type": "webrtc_answer",
+                        "data": {
+                            "success": True,
+                            "session_id": session_id,
+                            "stream_kind": stream_kind,
+                            "sdp": answer.sdp.as_text(),
+                        },
+                    }
+                except Exception as e:
+                    logger.error("Failed creating WebRTC answer: %s", e)
+                    message = {
+                        "type": "webrtc_error",
+                        "data": {"session_id": session_id, "error": str(e)},
+                    }
+                self._emit_webrtc(connection_id, {"v": 1, **message})
+
+            create_answer = _Gst.Promise.new_with_change_func(on_answer_created, None)
+            webrtcbin.emit("create-answer", None, create_answer)
+
+            return {
+                "success": True,
+                "pending": True,
+                "session_id": session_id,
+                "stream_kind": stream_kind,
+            }
+        except Exception as e:
+            logger.error("Failed handling WebRTC offer: %s", e)
+            return {"success": False, "message": str(e)}
 
     def add_webrtc_ice_candidate(
         self,
@@ -687,23 +1265,20 @@ class PreviewService:
         candidate: str,
         sdp_mline_index: int,
     ) -> Dict[str, Any]:
-        with self.state_lock:
-            session = self.webrtc_sessions.get(session_id)
-            if not session:
-                return {"success": False, "message": "Unknown session_id"}
-            if session.get("connection_id") != connection_id:
-                return {"success": False, "message": "Session does not belong to this connection"}
+        session, error = self._lookup_session(connection_id, session_id)
+        if session is None:
+            return {"success": False, "message": error}
 
-            webrtcbin = self._get_webrtcbin(session["pipeline_name"])
-            if webrtcbin is None:
-                return {"success": False, "message": "webrtcbin not found"}
+        webrtcbin = self._get_webrtcbin(session["pipeline_name"])
+        if webrtcbin is None:
+            return {"success": False, "message": "webrtcbin not found"}
 
-            try:
-                webrtcbin.emit("add-ice-candidate", int(sdp_mline_index), candidate)
-                return {"success": True}
-            except Exception as e:
-                logger.error("Failed to add ICE candidate: %s", e)
-                return {"success": False, "message": str(e)}
+        try:
+            webrtcbin.emit("add-ice-candidate", int(sdp_mline_index), candidate)
+            return {"success": True}
+        except Exception as e:
+            logger.error("Failed to add ICE candidate: %s", e)
+            return {"success": False, "message": str(e)}
 
     def stop_webrtc_session(self, connection_id: str, session_id: str) -> Dict[str, Any]:
         camera_to_stop: Optional[int] = None
@@ -716,18 +1291,18 @@ class PreviewService:
 
             cam_id = session.get("camera_id")
             self.webrtc_sessions.pop(session_id, None)
+            self._active_sessions_view.pop(session_id, None)
             self.connection_sessions.get(connection_id, set()).discard(session_id)
+            remaining = self.sessions_by_camera.get(cam_id, set())
+            remaining.discard(session_id)
+            self._invalidate_status_snapshot()
 
-            # If no more sessions on this camera, stop preview camera.
-            remaining = [
-                sid for sid, meta in self.webrtc_sessions.items()
-                if meta.get("camera_id") == cam_id and meta.get("active")
-            ]
+            # If no more sessions on this camera, stop preview camera
             if not remaining and cam_id is not None:
                 camera_to_stop = cam_id
 
         if camera_to_stop is not None:
-            self.stop_preview(camera_id=camera_to_stop)
+            self._release_webrtc_camera(camera_to_stop)
 
         return {"success": True}
 
@@ -737,18 +1312,32 @@ class PreviewService:
             session_ids = list(self.connection_sessions.get(connection_id, set()))
             for sid in session_ids:
                 meta = self.webrtc_sessions.pop(sid, None) or {}
+                self._active_sessions_view.pop(sid, None)
                 cam_id = meta.get("camera_id")
                 if isinstance(cam_id, int):
+                    self.sessions_by_camera.get(cam_id, set()).discard(sid)
                     cameras_to_consider.add(cam_id)
             self.connection_sessions.pop(connection_id, None)
+            self._invalidate_status_snapshot()
 
         for cam_id in cameras_to_consider:
-            active_for_camera = any(
-                meta.get("camera_id") == cam_id and meta.get("active")
-                for meta in self.webrtc_sessions.values()
-            )
-            if not active_for_camera:
-                self.stop_preview(camera_id=cam_id)
+            if not self.sessions_by_camera.get(cam_id):
+                self._release_webrtc_camera(cam_id)
+
+    def _release_webrtc_camera(self, cam_id: int) -> None:
+        """Stop a camera whose last WebRTC session ended, re-prewarming if enabled."""
+        self.stop_preview(camera_id=cam_id)
+        if self.webrtc_prewarm:
+            # A webrtcbin has already negotiated with its previous peer, so
+            # the next client needs a fresh pipeline rather than this one.
+            self._executor.submit(self._rewarm_webrtc, cam_id)
+
+    def _rewarm_webrtc(self, cam_id: int) -> None:
+        try:
+            self._wait_for_camera_teardown(cam_id, timeout=2.0)
+            self.prewarm_webrtc(cam_id)
+        except Exception as e:
+            logger.error("WebRTC re-prewarm failed for camera %s: %s", cam_id, e)
 
     # ---------------------------------------------------------------------
     # Cleanup
@@ -756,21 +1345,24 @@ class PreviewService:
 
     def cleanup(self):
         logger.info("PreviewService cleanup")
-        for cam_id in self.camera_ids:
-            if self.preview_active.get(cam_id):
-                try:
-                    self.stop_preview(cam_id)
-                except Exception as e:
-                    logger.error("Error stopping preview camera %s during cleanup: %s", cam_id, e)
+        # A full stop also tears down exposure sync, which per-camera stops skip.
+        try:
+            self.stop_preview()
+        except Exception as e:
+            logger.error("Error stopping preview during cleanup: %s", e)
+        self.wait_for_teardown(timeout=2.0)
 
 
 # Global instance
 _preview_service: Optional[PreviewService] = None
+_preview_service_lock = threading.Lock()
 
 
 def get_preview_service() -> PreviewService:
     """Get or create the global PreviewService instance."""
     global _preview_service
     if _preview_service is None:
-        _preview_service = PreviewService()
+        with _preview_service_lock:
+            if _preview_service is None:
+                _preview_service = PreviewService()
     return _preview_service
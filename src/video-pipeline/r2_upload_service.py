@@ -6,19 +6,28 @@ Uploads processed archive files to R2 bucket via S3-compatible API.
 
 import os
 import re
+import hmac
+import functools
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional
-from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
-# 100 MB multipart threshold / chunk size for large uploads
+# Multipart above 100 MB, in 16 MB parts so several parts are in flight at once
 _MULTIPART_THRESHOLD = 100 * 1024 * 1024
-_MULTIPART_CHUNKSIZE = 100 * 1024 * 1024
+_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+_MAX_CONCURRENCY = 8
+# Archive files uploaded at once; each runs its own multipart transfer
+_MAX_PARALLEL_FILES = 4
 
 
 class R2UploadService:
@@ -31,6 +40,15 @@ class R2UploadService:
       R2_BUCKET_NAME    - Target bucket (default: metcam-recordings)
     """
 
+    _DATE_RE = re.compile(r"(\d{8})")
+
+    _TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=_MULTIPART_THRESHOLD,
+        multipart_chunksize=_MULTIPART_CHUNKSIZE,
+        max_concurrency=_MAX_CONCURRENCY,
+        use_threads=True,
+    )
+
     def __init__(self) -> None:
         self.endpoint_url = os.getenv("R2_ENDPOINT_URL", "")
         self.access_key = os.getenv("R2_ACCESS_KEY_ID", "")
@@ -52,19 +70,34 @@ class R2UploadService:
             region_name="auto",
             config=Config(
                 retries={"max_attempts": 3, "mode": "adaptive"},
-                max_pool_connections=2,
+                # One connection per transfer worker of every parallel file
+                # upload, plus headroom so list calls don't wait behind them.
+                max_pool_connections=_MAX_PARALLEL_FILES * _MAX_CONCURRENCY + 2,
+                tcp_keepalive=True,
+                # R2 does not require payload checksums; skip hashing every
+                # multi-GB archive part on the way out.
+                request_checksum_calculation="when_required",
+                response_checksum_validation="when_required",
+                # Pinned so _batch_presign builds the same URLs as botocore.
+                s3={"addressing_style": "path"},
             ),
         )
         logger.info(f"R2 upload service initialized: {self.bucket}")
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _year_month_for(cls, match_id: str) -> Optional[str]:
+        """YYYY-MM from the date embedded in match_id, or None if it has none."""
+        date_match = cls._DATE_RE.search(match_id)
+        if not date_match:
+            return None
+        d = date_match.group(1)
+        return f"{d[:4]}-{d[4:6]}"
+
     def _build_key(self, match_id: str, filename: str) -> str:
         """Build R2 object key: YYYY-MM/match_id/filename"""
-        date_match = re.search(r"(\d{8})", match_id)
-        if date_match:
-            d = date_match.group(1)
-            year_month = f"{d[:4]}-{d[4:6]}"
-        else:
-            year_month = datetime.now().strftime("%Y-%m")
+        # Undated ids fall back to the current month, which must not be cached.
+        year_month = self._year_month_for(match_id) or datetime.now().strftime("%Y-%m")
         return f"{year_month}/{match_id}/{filename}"
 
     def upload_file(self, local_file: Path, key: str) -> bool:
@@ -84,11 +117,7 @@ class R2UploadService:
                 str(local_file),
                 self.bucket,
                 key,
-                Config=boto3.s3.transfer.TransferConfig(
-                    multipart_threshold=_MULTIPART_THRESHOLD,
-                    multipart_chunksize=_MULTIPART_CHUNKSIZE,
-                    max_concurrency=2,
-                ),
+                Config=self._TRANSFER_CONFIG,
                 ExtraArgs={"ContentType": "video/mp4"},
             )
             logger.info(f"Upload complete: {local_file.name} → {key}")
@@ -97,6 +126,10 @@ class R2UploadService:
             logger.error(f"Upload failed for {local_file.name}: {e}")
             return False
 
+    def _upload_one(self, archive_file: Path, match_id: str) -> Tuple[str, bool]:
+        key = self._build_key(match_id, archive_file.name)
+        return archive_file.name, self.upload_file(archive_file, key)
+
     def upload_match_archives(self, match_id: str, match_dir: Path) -> Dict:
         """Upload all archive files for a match to R2."""
         if not self.enabled:
@@ -122,12 +155,18 @@ class R2UploadService:
         uploaded = []
         failed = []
 
-        for archive_file in archive_files:
-            key = self._build_key(match_id, archive_file.name)
-            if self.upload_file(archive_file, key):
-                uploaded.append(archive_file.name)
-            else:
-                failed.append(archive_file.name)
+        workers = min(_MAX_PARALLEL_FILES, len(archive_files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="r2-upload") as executor:
+            futures = [
+                executor.submit(self._upload_one, archive_file, match_id)
+                for archive_file in archive_files
+            ]
+            for future in as_completed(futures):
+                name, ok = future.result()
+                if ok:
+                    uploaded.append(name)
+                else:
+                    failed.append(name)
 
         remote_prefix = self._build_key(match_id, "")
         return {
@@ -153,6 +192,54 @@ class R2UploadService:
             logger.error(f"Presigned URL error for {key}: {e}")
             return None
 
+    def _batch_presign(self, keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+        """Presign GET URLs for many keys with one SigV4 scope and signing key.
+
+        Produces the same query-string SigV4 URLs as ``generate_presigned_url``
+        (path-style, UNSIGNED-PAYLOAD), but derives the signing key once per
+        batch so each URL costs one SHA-256 and one HMAC instead of a full
+        botocore request build. Region and addressing style come from the
+        client; clients not configured for path-style addressing are presigned
+        through botocore key by key.
+        """
+        s3_config = self._client.meta.config.s3 or {}
+        if s3_config.get("addressing_style") != "path":
+            return {key: self.generate_presigned_url(key, expiration) for key in keys}
+
+        region = self._client.meta.region_name
+        endpoint = urlsplit(self.endpoint_url)
+        base_url = f"{endpoint.scheme}://{endpoint.netloc}"
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = now.strftime("%Y%m%d")
+        scope = f"{datestamp}/{region}/s3/aws4_request"
+
+        signing_key = ("AWS4" + self.secret_key).encode("utf-8")
+        for part in (datestamp, region, "s3", "aws4_request"):
+            signing_key = hmac.new(signing_key, part.encode("utf-8"), hashlib.sha256).digest()
+
+        # Parameter names are already in sorted order.
+        canonical_query = "&".join([
+            "X-Amz-Algorithm=AWS4-HMAC-SHA256",
+            f"X-Amz-Credential={quote(f'{self.access_key}/{scope}', safe='')}",
+            f"X-Amz-Date={amz_date}",
+            f"X-Amz-Expires={int(expiration)}",
+            "X-Amz-SignedHeaders=host",
+        ])
+        request_tail = f"\n{canonical_query}\nhost:{endpoint.netloc}\n\nhost\nUNSIGNED-PAYLOAD"
+        sign_prefix = f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+        # botocore keeps any endpoint path in front of the bucket.
+        bucket_path = f"{endpoint.path.rstrip('/')}/{quote(self.bucket, safe='')}/"
+
+        urls = {}
+        for key in keys:
+            path = bucket_path + quote(key, safe="/~")
+            canonical_request = f"GET\n{path}{request_tail}"
+            string_to_sign = sign_prefix + hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()
+            signature = hmac.new(signing_key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+            urls[key] = f"{base_url}{path}?{canonical_query}&X-Amz-Signature={signature}"
+        return urls
+
     def list_match_archives(self, match_id: str) -> list:
         """List all archive files for a match in R2 with presigned URLs."""
         if not self.enabled or not self._client:
@@ -160,24 +247,22 @@ class R2UploadService:
 
         prefix = self._build_key(match_id, "")
         try:
-            response = self._client.list_objects_v2(
-                Bucket=self.bucket,
-                Prefix=prefix
-            )
+            objects = []
+            paginator = self._client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    if obj['Key'].endswith('.mp4'):
+                        objects.append(obj)
+            urls = self._batch_presign(obj['Key'] for obj in objects)
             files = []
-            for obj in response.get('Contents', []):
+            for obj in objects:
                 key = obj['Key']
-                if not key.endswith('.mp4'):
-                    continue
-                name = key.rsplit('/', 1)[-1]
-                url = self.generate_presigned_url(key)
-                if url:
-                    files.append({
-                        'name': name,
-                        'key': key,
-                        'size_mb': round(obj['Size'] / (1024 * 1024), 2),
-                        'url': url,
-                    })
+                files.append({
+                    'name': key.rsplit('/', 1)[-1],
+                    'key': key,
+                    'size_mb': round(obj['Size'] / (1024 * 1024), 2),
+                    'url': urls[key],
+                })
             return files
         except Exception as e:
             logger.error(f"Failed to list R2 archives for {match_id}: {e}")
@@ -199,6 +284,8 @@ class R2UploadService:
                         continue
                     all_objects.append(obj)
 
+            urls = self._batch_presign(obj['Key'] for obj in all_objects)
+
             # Group by match (second path component)
             matches: dict = {}
             for obj in all_objects:
@@ -218,7 +305,7 @@ class R2UploadService:
                         'total_size_mb': 0,
                     }
 
-                url = self.generate_presigned_url(key)
+                url = urls[key]
                 size_mb = round(obj['Size'] / (1024 * 1024), 2)
                 matches[match_id]['files'].append({
                     'name': filename,
@@ -11,8 +11,9 @@ import re
 import logging
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from threading import Event, Lock, Thread
 
@@ -49,7 +50,9 @@ class RecordingService:
 
         # Recording state
         self.current_match_id: Optional[str] = None
-        self.recording_start_time: Optional[float] = None
+        self.recording_start_time: Optional[float] = None  # Wall clock, for reporting/persistence
+        self._recording_start_monotonic: Optional[float] = None  # Durations; immune to NTP steps
+        self._camera_started_at: Dict[int, float] = {}  # cam_id -> monotonic pipeline start
         self.process_after_recording: bool = False  # Post-processing flag
         self.state_lock = Lock()
 
@@ -61,6 +64,8 @@ class RecordingService:
         self.health_probe_cache_ttl_seconds = 10.0
         self.health_probe_min_size_bytes = 4 * 1024 * 1024  # Probe only larger/stable segments.
         self.health_probe_min_stable_age_seconds = 10.0
+        # (segments_dir, dir mtime_ns, {cam_id: newest segment path})
+        self._latest_segments_cache: Optional[Tuple[Path, int, Dict[int, Path]]] = None
         self.overload_guard_state: Dict[str, Any] = {}
         self._overload_monitor_stop_event = Event()
         self._overload_monitor_thread: Optional[Thread] = None
@@ -370,8 +375,16 @@ class RecordingService:
             logger.warning("Failed to load quality preset from config: %s, using 'high'", e)
             return 'high'
 
-    def _probe_segment_integrity(self, path: Path, now: float) -> Dict[str, Any]:
-        """Probe a finalized segment with ffprobe, using a short-lived cache."""
+    def _probe_segment_integrity(
+        self,
+        path: Path,
+        now: float,
+        st: Optional[os.stat_result] = None,
+    ) -> Dict[str, Any]:
+        """
+        Probe a finalized segment with ffprobe, using a short-lived cache.
+        Callers that already stat'ed the segment pass ``st`` to skip a second stat.
+        """
         def _prune_probe_cache(max_entries: int = 200):
             if len(self.health_probe_cache) <= max_entries:
                 return
@@ -384,8 +397,10 @@ class RecordingService:
 
         path_key = str(path)
         cache_entry = self.health_probe_cache.get(path_key)
-        mtime = path.stat().st_mtime
-        size = path.stat().st_size
+        if st is None:
+            st = path.stat()
+        mtime = st.st_mtime
+        size = st.st_size
         if cache_entry:
             same_file_state = (
                 cache_entry.get("mtime") == mtime
@@ -453,7 +468,9 @@ class RecordingService:
             return result
 
         if probe.returncode != 0:
-            error_text = (probe.stderr or "").strip()
+            # Corrupt files can make ffprobe log per-packet errors; the cached
+            # result and alerts only keep the tail.
+            error_text = (probe.stderr or "")[-2048:].strip()
             result = {
                 "checked": True,
                 "ok": False,
@@ -503,6 +520,50 @@ class RecordingService:
         _prune_probe_cache()
         return result
 
+    def _latest_segments(self, segments_dir: Path) -> Dict[int, Tuple[Path, os.stat_result]]:
+        """
+        Newest .mp4/.mkv segment per camera, from a single directory scan.
+        Each entry is stat'ed once and the result is returned with the path.
+
+        Segments only appear on splitmux rollover, so while the directory
+        mtime is unchanged the previous answer is reused and only the newest
+        files are re-stat'ed. Directories modified within the last second
+        are not cached, as another entry may land in the same mtime tick.
+        """
+        dir_mtime_ns = os.stat(segments_dir).st_mtime_ns
+        cached = self._latest_segments_cache
+        if cached is not None and cached[0] == segments_dir and cached[1] == dir_mtime_ns:
+            try:
+                return {cam_id: (path, os.stat(path)) for cam_id, path in cached[2].items()}
+            except FileNotFoundError:
+                pass
+
+        prefixes = [(cam_id, f"cam{cam_id}_") for cam_id in self.camera_ids]
+        latest: Dict[int, Tuple[Path, os.stat_result]] = {}
+        with os.scandir(segments_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith((".mp4", ".mkv")):
+                    continue
+                for cam_id, prefix in prefixes:
+                    if not name.startswith(prefix):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        break
+                    current = latest.get(cam_id)
+                    if current is None or st.st_mtime > current[1].st_mtime:
+                        latest[cam_id] = (Path(entry.path), st)
+                    break
+        if time.time_ns() - dir_mtime_ns > 1_000_000_000:
+            self._latest_segments_cache = (
+                segments_dir,
+                dir_mtime_ns,
+                {cam_id: path for cam_id, (path, _) in latest.items()},
+            )
+        return latest
+
     def _collect_stop_integrity(self, match_id: str) -> Dict[str, Any]:
         """Collect per-camera segment integrity immediately after recording stop."""
         result: Dict[str, Any] = {
@@ -520,11 +581,11 @@ class RecordingService:
         any_segments = False
         all_checked = True
         all_ok = True
+        latest_segments = self._latest_segments(segments_dir)
 
         for cam_id in self.camera_ids:
             camera_key = f"camera_{cam_id}"
-            cam_segments = list(segments_dir.glob(f"cam{cam_id}_*.mp4")) + list(segments_dir.glob(f"cam{cam_id}_*.mkv"))
-            if not cam_segments:
+            if cam_id not in latest_segments:
                 result["cameras"][camera_key] = {
                     "segment_found": False,
                     "segment_path": None,
@@ -536,8 +597,8 @@ class RecordingService:
                 continue
 
             any_segments = True
-            latest = max(cam_segments, key=lambda path: path.stat().st_mtime)
-            probe_result = self._probe_segment_integrity(latest, now)
+            latest, latest_stat = latest_segments[cam_id]
+            probe_result = self._probe_segment_integrity(latest, now, latest_stat)
             checked = bool(probe_result.get("checked"))
             ok_value = bool(probe_result.get("ok")) if checked else None
             if not checked:
@@ -548,7 +609,7 @@ class RecordingService:
             result["cameras"][camera_key] = {
                 "segment_found": True,
                 "segment_path": str(latest),
-                "segment_size": latest.stat().st_size,
+                "segment_size": latest_stat.st_size,
                 "integrity_checked": checked,
                 "integrity_ok": ok_value,
                 "integrity_error": probe_result.get("error"),
@@ -692,6 +753,7 @@ class RecordingService:
             state['last_recovery_ts'] = time.time()
 
             if started:
+                self._camera_started_at[camera_id] = time.monotonic()
                 state['last_error'] = None
                 state['failed_permanently'] = False
                 self.degraded_cameras.pop(f"camera_{camera_id}", None)
@@ -739,6 +801,14 @@ class RecordingService:
                     if cam0_exists and cam1_exists:
                         self.current_match_id = match_id
                         self.recording_start_time = start_time
+                        self._recording_start_monotonic = (
+                            time.monotonic() - max(0.0, time.time() - start_time)
+                            if start_time else None
+                        )
+                        if self._recording_start_monotonic is not None:
+                            self._camera_started_at = dict.fromkeys(
+                                self.camera_ids, self._recording_start_monotonic
+                            )
                         self.process_after_recording = process_after
                         logger.info("Recording pipelines still active after restart")
                     else:
@@ -749,6 +819,10 @@ class RecordingService:
             logger.error(f"Failed to load recording state: {e}")
             self._clear_state()
     
+    def _state_tmp_file(self) -> Path:
+        """Per-process hidden temp name, so readers scanning the directory skip it."""
+        return self.state_file.with_name(f".{self.state_file.name}.{os.getpid()}.tmp")
+
     def _save_state(self):
         """Persist recording state to disk"""
         try:
@@ -760,19 +834,27 @@ class RecordingService:
                 'timestamp': time.time()
             }
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            tmp_state_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+            tmp_state_file = self._state_tmp_file()
 
-            with open(tmp_state_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2)
+            fd = os.open(tmp_state_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
                 f.flush()
                 os.fsync(f.fileno())
 
             os.replace(tmp_state_file, self.state_file)
 
+            # Make the rename itself durable, not just the file contents.
+            dir_fd = os.open(self.state_file.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
         except Exception as e:
             logger.error(f"Failed to save recording state: {e}")
             try:
-                tmp_state_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+                tmp_state_file = self._state_tmp_file()
                 if tmp_state_file.exists():
                     tmp_state_file.unlink()
             except Exception:
@@ -790,59 +872,83 @@ class RecordingService:
         """
         Get current recording status
         Returns instantly (no delays)
-        """
-        with self.state_lock:
-            if self.current_match_id is None:
-                return {
-                    'recording': False,
-                    'match_id': None,
-                    'duration': 0.0,
-                    'cameras': {},
-                    'degraded': False,
-                    'degraded_cameras': {},
-                    'camera_recovery': {},
-                    'overload_guard': dict(self.overload_guard_state),
-                }
-            
-            # Calculate duration
-            duration = time.time() - self.recording_start_time if self.recording_start_time else 0.0
-            
-            # Get pipeline info
-            cameras = {}
-            for cam_id in self.camera_ids:
-                pipeline_name = f'recording_cam{cam_id}'
-                info = self.gst_manager.get_pipeline_status(pipeline_name)
-                
-                if info:
-                    cameras[f'camera_{cam_id}'] = {
-                        "state": info.state.value,
-                        "uptime": (datetime.utcnow() - info.start_time).total_seconds() if info.start_time else 0.0
-                    }
 
-            camera_recovery = {
-                f"camera_{cam_id}": {
-                    "attempts": state.get('attempts', 0),
-                    "recovering": state.get('recovering', False),
-                    "failed_permanently": state.get('failed_permanently', False),
-                    "last_error": state.get('last_error'),
-                    "last_recovery_ts": state.get('last_recovery_ts'),
-                }
-                for cam_id, state in self.camera_recovery_state.items()
-            }
-            
+        Does not take state_lock, so dashboard polls never queue behind a
+        start or a stop that is waiting on EOS. Shared state is read once
+        into locals and the dicts are copied atomically.
+        """
+        match_id = self.current_match_id
+        if match_id is None:
             return {
-                'recording': True,
-                'match_id': self.current_match_id,
-                'duration': duration,
-                'cameras': cameras,
-                'protected': duration < self.protection_seconds,
-                'require_all_cameras': self.require_all_cameras,
-                'degraded': bool(self.degraded_cameras),
-                'degraded_cameras': self.degraded_cameras.copy(),
-                'camera_recovery': camera_recovery,
+                'recording': False,
+                'match_id': None,
+                'duration': 0.0,
+                'cameras': {},
+                'degraded': False,
+                'degraded_cameras': {},
+                'camera_recovery': {},
                 'overload_guard': dict(self.overload_guard_state),
             }
-    
+
+        # Calculate duration
+        duration = self._recording_elapsed_seconds()
+
+        # Get pipeline info
+        cameras = {}
+        camera_started_at = self._camera_started_at
+        now = time.monotonic()
+        for cam_id in self.camera_ids:
+            pipeline_name = f'recording_cam{cam_id}'
+            info = self.gst_manager.get_pipeline_status(pipeline_name)
+
+            if info:
+                cameras[f'camera_{cam_id}'] = {
+                    "state": info.state.value,
+                    # Monotonic like duration, so the two agree across NTP steps.
+                    "uptime": now - camera_started_at[cam_id] if cam_id in camera_started_at else 0.0
+                }
+
+        camera_recovery = {
+            f"camera_{cam_id}": {
+                "attempts": state.get('attempts', 0),
+                "recovering": state.get('recovering', False),
+                "failed_permanently": state.get('failed_permanently', False),
+                "last_error": state.get('last_error'),
+                "last_recovery_ts": state.get('last_recovery_ts'),
+            }
+            for cam_id, state in list(self.camera_recovery_state.items())
+        }
+        degraded_cameras = self.degraded_cameras.copy()
+
+        return {
+            'recording': True,
+            'match_id': match_id,
+            'duration': duration,
+            'cameras': cameras,
+            'protected': duration < self.protection_seconds,
+            'require_all_cameras': self.require_all_cameras,
+            'degraded': bool(degraded_cameras),
+            'degraded_cameras': degraded_cameras,
+            'camera_recovery': camera_recovery,
+            'overload_guard': dict(self.overload_guard_state),
+        }
+
+    def _recording_elapsed_seconds(self) -> float:
+        """Seconds since the active recording started, from the monotonic clock."""
+        start = self._recording_start_monotonic
+        if start is None:
+            return 0.0
+        return time.monotonic() - start
+
+    def is_recording(self) -> bool:
+        """
+        Cheap recording check for mutual-exclusion guards.
+        Reads a single attribute without taking state_lock, so it never
+        blocks behind a start/stop in progress and skips the per-camera
+        pipeline queries done by get_status().
+        """
+        return self.current_match_id is not None
+
     def start_recording(self, match_id: str, force: bool = False, process_after_recording: bool = False) -> Dict:
         """
         Start dual-camera recording
@@ -878,6 +984,7 @@ class RecordingService:
             # Start both cameras
             started_cameras = []
             failed_cameras = []
+            camera_started_at: Dict[int, float] = {}
             
             for cam_id in self.camera_ids:
                 try:
@@ -920,6 +1027,7 @@ class RecordingService:
                         continue
                     
                     started_cameras.append(cam_id)
+                    camera_started_at[cam_id] = time.monotonic()
                     logger.info(f"Camera {cam_id} recording started")
                     
                 except Exception as e:
@@ -966,6 +1074,8 @@ class RecordingService:
             # Update state
             self.current_match_id = match_id
             self.recording_start_time = time.time()
+            self._recording_start_monotonic = time.monotonic()
+            self._camera_started_at = camera_started_at
             self.process_after_recording = process_after_recording
 
             # Persist state
@@ -983,6 +1093,50 @@ class RecordingService:
                 'require_all_cameras': self.require_all_cameras
             }
     
+    def _stop_camera_pipeline(self, cam_id: int) -> Dict[str, Any]:
+        """Stop one recording pipeline with EOS and return its stop details."""
+        pipeline_name = f'recording_cam{cam_id}'
+        try:
+            # Graceful stop with EOS, forcing NULL state after configured timeout.
+            if hasattr(self.gst_manager, "stop_pipeline_with_details"):
+                details = self.gst_manager.stop_pipeline_with_details(
+                    pipeline_name,
+                    wait_for_eos=True,
+                    timeout=self.stop_eos_timeout_seconds,
+                )
+            else:
+                # Backward-compatibility path for tests/stubs without the new API.
+                success = self.gst_manager.stop_pipeline(
+                    pipeline_name,
+                    wait_for_eos=True,
+                    timeout=self.stop_eos_timeout_seconds,
+                )
+                details = {
+                    "success": bool(success),
+                    "eos_received": bool(success),
+                    "timed_out": False,
+                    "error": None if success else "stop_pipeline returned False",
+                }
+            details["finalized"] = bool(
+                details.get("success")
+                and details.get("eos_received", False)
+                and not details.get("timed_out", False)
+                and not details.get("error")
+            )
+            logger.info(f"Camera {cam_id} recording stopped")
+            # Remove pipeline from memory to allow fresh start next time
+            self.gst_manager.remove_pipeline(pipeline_name)
+            return details
+        except Exception as e:
+            logger.error(f"Failed to stop camera {cam_id}: {e}")
+            return {
+                "success": False,
+                "eos_received": False,
+                "timed_out": False,
+                "finalized": False,
+                "error": str(e),
+            }
+
     def _stop_recording_internal(self, force: bool = False) -> Dict[str, Any]:
         """
         Internal method to stop recording
@@ -1003,7 +1157,7 @@ class RecordingService:
         
         # Check recording protection
         if not force:
-            duration = time.time() - self.recording_start_time if self.recording_start_time else 0.0
+            duration = self._recording_elapsed_seconds()
             if duration < self.protection_seconds:
                 raise ValueError(
                     f"Recording protected for {self.protection_seconds}s. "
@@ -1014,51 +1168,18 @@ class RecordingService:
 
         self._stop_overload_guard()
 
-        # Stop both cameras
-        camera_stop_results = {}
-        for cam_id in self.camera_ids:
-            pipeline_name = f'recording_cam{cam_id}'
-            try:
-                # Graceful stop with EOS, forcing NULL state after configured timeout.
-                if hasattr(self.gst_manager, "stop_pipeline_with_details"):
-                    details = self.gst_manager.stop_pipeline_with_details(
-                        pipeline_name,
-                        wait_for_eos=True,
-                        timeout=self.stop_eos_timeout_seconds,
-                    )
-                else:
-                    # Backward-compatibility path for tests/stubs without the new API.
-                    success = self.gst_manager.stop_pipeline(
-                        pipeline_name,
-                        wait_for_eos=True,
-                        timeout=self.stop_eos_timeout_seconds,
-                    )
-                    details = {
-                        "success": bool(success),
-                        "eos_received": bool(success),
-                        "timed_out": False,
-                        "error": None if success else "stop_pipeline returned False",
-                    }
-                details["finalized"] = bool(
-                    details.get("success")
-                    and details.get("eos_received", False)
-                    and not details.get("timed_out", False)
-                    and not details.get("error")
-                )
-                logger.info(f"Camera {cam_id} recording stopped")
-                camera_stop_results[f"camera_{cam_id}"] = details
-                # Remove pipeline from memory to allow fresh start next time
-                self.gst_manager.remove_pipeline(pipeline_name)
-            except Exception as e:
-                logger.error(f"Failed to stop camera {cam_id}: {e}")
-                camera_stop_results[f"camera_{cam_id}"] = {
-                    "success": False,
-                    "eos_received": False,
-                    "timed_out": False,
-                    "finalized": False,
-                    "error": str(e),
-                }
-        
+        # Stop both cameras. Each EOS wait runs on its own thread so the
+        # cameras finalize concurrently instead of back to back.
+        with ThreadPoolExecutor(
+            max_workers=len(self.camera_ids),
+            thread_name_prefix="recording-stop",
+        ) as executor:
+            stop_details = list(executor.map(self._stop_camera_pipeline, self.camera_ids))
+        camera_stop_results = {
+            f"camera_{cam_id}": details
+            for cam_id, details in zip(self.camera_ids, stop_details)
+        }
+
         # Trigger post-processing if enabled
         should_process = self.process_after_recording
         match_id_for_processing = self.current_match_id
@@ -1079,6 +1200,8 @@ class RecordingService:
         # Clear state
         self.current_match_id = None
         self.recording_start_time = None
+        self._recording_start_monotonic = None
+        self._camera_started_at = {}
         self.process_after_recording = False
         self._init_recovery_state()
         self._clear_state()
@@ -1144,14 +1267,14 @@ class RecordingService:
             if not segments_dir.exists():
                 return {"healthy": False, "message": "Segments directory does not exist"}
 
-            segments = list(segments_dir.glob("*.mp4")) + list(segments_dir.glob("*.mkv"))
-            recording_age = time.time() - self.recording_start_time if self.recording_start_time else 0
+            latest_segments = self._latest_segments(segments_dir)
+            recording_age = self._recording_elapsed_seconds()
             recovery_attempts = {
                 f"camera_{cam_id}": self.camera_recovery_state.get(cam_id, {}).get("attempts", 0)
                 for cam_id in self.camera_ids
             }
 
-            if not segments:
+            if not latest_segments:
                 if recording_age > 10:
                     return {
                         "healthy": False,
@@ -1180,16 +1303,15 @@ class RecordingService:
                 elif pipeline_info.state.value != "running":
                     issues.append(f"cam{cam_id}: Pipeline state {pipeline_info.state.value}")
 
-                cam_segments = [segment for segment in segments if f"cam{cam_id}_" in segment.name]
-                if not cam_segments:
+                if cam_id not in latest_segments:
                     camera_diagnostics[camera_key]["latest_segment"] = None
                     if recording_age > 20:
                         issues.append(f"cam{cam_id}: No segment files after 20 seconds")
                     continue
 
-                latest = max(cam_segments, key=lambda path: path.stat().st_mtime)
-                size = latest.stat().st_size
-                age = time.time() - latest.stat().st_mtime
+                latest, latest_stat = latest_segments[cam_id]
+                size = latest_stat.st_size
+                age = time.time() - latest_stat.st_mtime
                 camera_diagnostics[camera_key]["latest_segment"] = latest.name
                 camera_diagnostics[camera_key]["latest_segment_size"] = size
                 camera_diagnostics[camera_key]["latest_segment_age_seconds"] = round(age, 3)
@@ -1236,7 +1358,7 @@ class RecordingService:
                     and size >= self.health_probe_min_size_bytes
                 )
                 if should_probe:
-                    probe_result = self._probe_segment_integrity(latest, now)
+                    probe_result = self._probe_segment_integrity(latest, now, latest_stat)
                     camera_diagnostics[camera_key]["integrity_probe"] = probe_result
                     if probe_result.get("checked") and probe_result.get("ok") is False:
                         issues.append(f"cam{cam_id}: Segment probe failed ({probe_result.get('error')})")
@@ -1244,7 +1366,7 @@ class RecordingService:
                 self.health_last_segment_snapshot[cam_id] = {
                     "name": latest.name,
                     "size": size,
-                    "mtime": latest.stat().st_mtime,
+                    "mtime": latest_stat.st_mtime,
                     "index": latest_index,
                     "checked_at": now,
                 }
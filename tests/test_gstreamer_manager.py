@@ -0,0 +1,132 @@
+import importlib.util
+import sys
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class _FakeMessageType:
+    EOS = 1
+    ERROR = 2
+    WARNING = 4
+    STATE_CHANGED = 8
+
+
+class _FakeError:
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class _FakeMessage:
+    def __init__(self, message_type: int, error: str = "") -> None:
+        self.type = message_type
+        self._error = error
+
+    def parse_error(self):
+        return _FakeError(self._error), "debug"
+
+
+class _FakeBus:
+    def __init__(self) -> None:
+        self.handlers = []
+
+    def add_signal_watch(self) -> None:
+        pass
+
+    def remove_signal_watch(self) -> None:
+        pass
+
+    def connect(self, signal: str, handler) -> None:
+        self.handlers.append(handler)
+
+    def post(self, message: _FakeMessage) -> None:
+        for handler in self.handlers:
+            handler(self, message)
+
+
+class _FakePipeline:
+    def __init__(self) -> None:
+        self.bus = _FakeBus()
+
+    def get_bus(self) -> _FakeBus:
+        return self.bus
+
+    def set_state(self, state):
+        return "success"
+
+
+class _FakeMainLoop:
+    def __init__(self) -> None:
+        self._quit = threading.Event()
+
+    def run(self) -> None:
+        self._quit.wait()
+
+    def quit(self) -> None:
+        self._quit.set()
+
+
+def load_gstreamer_manager_module():
+    gst = types.SimpleNamespace(
+        init=lambda argv: None,
+        parse_launch=lambda description: _FakePipeline(),
+        MessageType=_FakeMessageType,
+        State=types.SimpleNamespace(NULL="null", PLAYING="playing"),
+        StateChangeReturn=types.SimpleNamespace(FAILURE="failure", SUCCESS="success"),
+    )
+    repository = types.ModuleType("gi.repository")
+    repository.Gst = gst
+    repository.GLib = types.SimpleNamespace(MainLoop=_FakeMainLoop)
+    gi_stub = types.ModuleType("gi")
+    gi_stub.require_version = lambda name, version: None
+    gi_stub.repository = repository
+    sys.modules["gi"] = gi_stub
+    sys.modules["gi.repository"] = repository
+
+    module_name = f"gstreamer_manager_test_{time.time_ns()}"
+    module_path = Path(__file__).resolve().parents[1] / "src/video-pipeline/gstreamer_manager.py"
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if not spec or not spec.loader:
+        raise RuntimeError("Could not load gstreamer_manager module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestGStreamerManager(unittest.TestCase):
+    def setUp(self) -> None:
+        modules_patch = mock.patch.dict(sys.modules)
+        modules_patch.start()
+        self.addCleanup(modules_patch.stop)
+        self.module = load_gstreamer_manager_module()
+        self.manager = self.module.GStreamerManager()
+
+    def tearDown(self) -> None:
+        self.manager.loop.quit()
+
+    def test_error_state_is_recorded_before_on_error_runs(self) -> None:
+        seen_states = []
+
+        def on_error(name, error, debug, metadata):
+            seen_states.append(self.manager.get_pipeline_status(name).state)
+
+        self.assertTrue(self.manager.create_pipeline("preview_cam0", "fake ! pipeline", on_error=on_error))
+        self.assertTrue(self.manager.start_pipeline("preview_cam0"))
+
+        pipeline = self.manager.pipelines["preview_cam0"]["pipeline"]
+        pipeline.bus.post(_FakeMessage(_FakeMessageType.ERROR, "sensor lost"))
+
+        self.assertEqual(seen_states, [self.module.PipelineState.ERROR])
+        status = self.manager.get_pipeline_status("preview_cam0")
+        self.assertEqual(status.error_message, "sensor lost")
+
+
+if __name__ == "__main__":
+    unittest.main()
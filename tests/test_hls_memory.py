@@ -0,0 +1,100 @@
+import importlib.util
+import sys
+import time
+import unittest
+from pathlib import Path
+
+
+def load_hls_memory_module():
+    module_name = f"hls_memory_test_{time.time_ns()}"
+    module_path = Path(__file__).resolve().parents[1] / "src/video-pipeline/hls_memory.py"
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if not spec or not spec.loader:
+        raise RuntimeError("Could not load hls_memory module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestHlsSegmentRing(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = load_hls_memory_module()
+        self.ring = self.module.HlsSegmentRing("cam0", capacity=3, target_duration=2.0)
+
+    def _feed_gops(self, count: int, start: float = 0.0) -> float:
+        now = start
+        for gop in range(count):
+            self.ring.push(b"K%d" % gop, keyframe=True, now=now)
+            self.ring.push(b"d", keyframe=False, now=now + 1.0)
+            now += 2.0
+        return now
+
+    def test_playlist_unavailable_until_first_segment_completes(self) -> None:
+        self.ring.push(b"K", keyframe=True, now=0.0)
+        self.assertIsNone(self.ring.playlist())
+        self.assertIsNone(self.ring.latest_segment())
+
+    def test_segments_cut_on_keyframe_after_target_duration(self) -> None:
+        self._feed_gops(3)
+
+        playlist = self.ring.playlist().decode("ascii")
+
+        self.assertIn("#EXT-X-MEDIA-SEQUENCE:0", playlist)
+        self.assertIn("cam0_00000.ts", playlist)
+        self.assertIn("cam0_00001.ts", playlist)
+        self.assertIn("#EXTINF:2.000,", playlist)
+        self.assertEqual(self.ring.segment(0), b"K0d")
+        self.assertEqual(self.ring.latest_segment(), b"K1d")
+
+    def test_leading_delta_buffers_are_dropped(self) -> None:
+        self.ring.push(b"x", keyframe=False, now=0.0)
+        self._feed_gops(2, start=1.0)
+
+        self.assertEqual(self.ring.segment(0), b"K0d")
+
+    def test_ring_evicts_oldest_segments_at_capacity(self) -> None:
+        self._feed_gops(6)
+
+        playlist = self.ring.playlist().decode("ascii")
+
+        self.assertIn("#EXT-X-MEDIA-SEQUENCE:2", playlist)
+        self.assertIsNone(self.ring.segment(1))
+        self.assertEqual(self.ring.segment(4), b"K4d")
+
+    def test_reads_share_the_published_snapshot_until_rotation(self) -> None:
+        end = self._feed_gops(3)
+        playlist = self.ring.playlist()
+
+        self.assertIs(self.ring.playlist(), playlist)
+        self.assertIsNone(self.ring.segment(2))
+        self.assertIsNone(self.ring.segment(-1))
+
+        self._feed_gops(2, start=end)
+
+        self.assertIsNot(self.ring.playlist(), playlist)
+        self.assertEqual(self.ring.segment(2), b"K2d")
+        self.assertIn(b"cam0_00001.ts", playlist)
+
+    def test_playlist_buffer_grows_when_a_playlist_outgrows_it(self) -> None:
+        ring = self.module.HlsSegmentRing("cam0_" + "x" * 400, capacity=16, target_duration=2.0)
+        self.ring = ring
+        self._feed_gops(17)
+
+        playlist = ring.playlist()
+        self.assertGreater(len(playlist), 4096)
+        self.assertTrue(playlist.startswith(b"#EXTM3U\n"))
+        self.assertTrue(playlist.endswith(b"%s_00015.ts\n" % ring.name_prefix.encode()))
+
+    def test_reset_keeps_sequence_numbers_increasing(self) -> None:
+        end = self._feed_gops(3)
+        self.ring.reset()
+        self.assertIsNone(self.ring.playlist())
+
+        self._feed_gops(2, start=end)
+
+        self.assertIn("cam0_00002.ts", self.ring.playlist().decode("ascii"))
+
+
+if __name__ == "__main__":
+    unittest.main()
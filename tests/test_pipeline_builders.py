@@ -1,5 +1,6 @@
 import importlib.util
 import json
+import os
 import sys
 import tempfile
 import time
@@ -51,6 +52,18 @@ class TestPipelineBuilders(unittest.TestCase):
         self.assertEqual(data["recording_quality"], "balanced")
         self.assertEqual(data["cameras"]["0"]["crop"]["left"], 480)
 
+    def test_load_camera_config_rereads_only_when_file_changes(self) -> None:
+        first = self.module.load_camera_config(str(self.config_path))
+        self.assertIs(self.module.load_camera_config(str(self.config_path)), first)
+
+        self.config_data["recording_quality"] = "fast"
+        self.config_data["cameras"]["0"]["crop"]["left"] = 512
+        self.config_path.write_text(json.dumps(self.config_data), encoding="utf-8")
+
+        reloaded = self.module.load_camera_config(str(self.config_path))
+        self.assertEqual(reloaded["recording_quality"], "fast")
+        self.assertEqual(reloaded["cameras"]["0"]["crop"]["left"], 512)
+
     def test_pixel_count_to_edge_coords(self) -> None:
         coords = self.module.pixel_count_to_edge_coords({"left": 100, "right": 150, "top": 20, "bottom": 30})
         self.assertEqual(coords, (100, 3690, 20, 2130))
@@ -170,6 +183,15 @@ class TestPipelineBuilders(unittest.TestCase):
         self.assertIn("location=/dev/shm/hls/cam1_%05d.ts", pipeline)
         self.assertIn("aud=true", pipeline)
 
+    def test_build_preview_memory_hls_pipeline_ends_in_appsink(self) -> None:
+        pipeline = self.module.build_preview_memory_hls_pipeline(
+            camera_id=0,
+            config_path=str(self.config_path),
+        )
+        self.assertIn("mpegtsmux name=mux", pipeline)
+        self.assertIn("appsink name=hlssink emit-signals=true", pipeline)
+        self.assertNotIn("hlssink2", pipeline)
+
     def test_build_preview_webrtc_pipeline_contains_webrtcbin(self) -> None:
         pipeline = self.module.build_preview_webrtc_pipeline(
             camera_id=0,
@@ -222,6 +244,51 @@ class TestPipelineBuilders(unittest.TestCase):
         self.assertIn("nvarguscamerasrc", pipeline)
         self.assertIn("sensor-id=0", pipeline)
 
+    def test_preview_pipelines_use_nvenc_from_nvmm_when_selected(self) -> None:
+        previous = os.environ.get("PREVIEW_ENCODER")
+        os.environ["PREVIEW_ENCODER"] = "nvv4l2h264enc"
+        try:
+            pipelines = [
+                self.module.build_preview_memory_hls_pipeline(camera_id=0, config_path=str(self.config_path)),
+                self.module.build_preview_webrtc_pipeline(camera_id=0, config_path=str(self.config_path)),
+                self.module.build_preview_rtsp_pipeline(camera_id=0, config_path=str(self.config_path)),
+            ]
+        finally:
+            if previous is None:
+                os.environ.pop("PREVIEW_ENCODER", None)
+            else:
+                os.environ["PREVIEW_ENCODER"] = previous
+
+        for pipeline in pipelines:
+            self.assertIn("nvv4l2h264enc name=enc bitrate=6000000", pipeline)
+            self.assertIn("height=1616 ! nvv4l2h264enc", pipeline)
+            self.assertNotIn("x264enc", pipeline)
+            self.assertNotIn("format=I420", pipeline)
+            self.assertIn("h264parse config-interval=1", pipeline)
+
+    def test_recording_pipeline_uses_nvenc_from_nvmm_when_selected(self) -> None:
+        previous = os.environ.get("RECORDING_ENCODER")
+        os.environ["RECORDING_ENCODER"] = "nvv4l2h264enc"
+        try:
+            pipeline = self.module.build_recording_pipeline(
+                camera_id=0,
+                output_pattern="/tmp/cam0_%02d.mp4",
+                config_path=str(self.config_path),
+                quality_preset="balanced",
+            )
+        finally:
+            if previous is None:
+                os.environ.pop("RECORDING_ENCODER", None)
+            else:
+                os.environ["RECORDING_ENCODER"] = previous
+
+        self.assertIn("nvv4l2h264enc name=enc bitrate=22000000", pipeline)
+        self.assertIn("iframeinterval=90", pipeline)
+        self.assertNotIn("x264enc", pipeline)
+        self.assertNotIn("format=I420", pipeline)
+        self.assertIn("h264parse config-interval=-1", pipeline)
+        self.assertIn("splitmuxsink name=sink", pipeline)
+
     def test_build_panorama_capture_pipeline_contains_appsink_branch(self) -> None:
         pipeline = self.module.build_panorama_capture_pipeline(camera_id=0, config_path=str(self.config_path))
         self.assertIn("tee name=t", pipeline)
@@ -0,0 +1,87 @@
+import importlib.util
+import os
+import sys
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+try:
+    import botocore.auth
+except ImportError:  # boto3 is only installed on the device
+    botocore = None
+
+
+FROZEN_NOW = datetime(2026, 3, 14, 15, 9, 26, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW if tz is not None else FROZEN_NOW.replace(tzinfo=None)
+
+
+def load_r2_upload_module():
+    module_name = f"r2_upload_service_test_{time.time_ns()}"
+    module_path = Path(__file__).resolve().parents[1] / "src/video-pipeline/r2_upload_service.py"
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if not spec or not spec.loader:
+        raise RuntimeError("Could not load r2_upload_service module")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipIf(botocore is None, "boto3 is not installed")
+class TestBatchPresign(unittest.TestCase):
+    KEYS = [
+        "2026-03/match_20260314/cam0 archive.mp4",
+        "2026-03/match_20260314/Zagreb–Split ü.mp4",
+        "2026-03/match_20260314/half+1~final.mp4",
+    ]
+
+    def setUp(self) -> None:
+        self.module = load_r2_upload_module()
+        frozen = [
+            mock.patch.object(self.module, "datetime", _FrozenDatetime),
+            mock.patch.object(
+                botocore.auth, "get_current_datetime", lambda *args, **kwargs: FROZEN_NOW.replace(tzinfo=None)
+            ),
+        ]
+        for patcher in frozen:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _service(self, endpoint_url: str):
+        env = {
+            "R2_ENDPOINT_URL": endpoint_url,
+            "R2_ACCESS_KEY_ID": "AKIDEXAMPLE",
+            "R2_SECRET_ACCESS_KEY": "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+            "R2_BUCKET_NAME": "metcam-recordings",
+        }
+        with mock.patch.dict(os.environ, env):
+            return self.module.R2UploadService()
+
+    def _assert_matches_botocore(self, service) -> None:
+        urls = service._batch_presign(self.KEYS, expiration=900)
+        for key in self.KEYS:
+            expected = service._client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": service.bucket, "Key": key},
+                ExpiresIn=900,
+            )
+            self.assertEqual(urls[key], expected)
+
+    def test_batch_presign_matches_botocore(self) -> None:
+        self._assert_matches_botocore(self._service("https://account.r2.cloudflarestorage.com"))
+
+    def test_batch_presign_keeps_endpoint_path(self) -> None:
+        service = self._service("https://account.r2.cloudflarestorage.com/tenant/")
+        self._assert_matches_botocore(service)
+        self.assertIn("/tenant/metcam-recordings/", service._batch_presign(self.KEYS[:1])[self.KEYS[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
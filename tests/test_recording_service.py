@@ -3,10 +3,11 @@ import json
 import os
 import sys
 import tempfile
+import threading
 import time
 import types
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest import mock
 
@@ -146,6 +147,10 @@ class TestRecordingService(unittest.TestCase):
         for cam_id in self.service.camera_ids:
             self.service.gst_manager.statuses[f"recording_cam{cam_id}"] = FakePipelineStatus(state="running")
 
+    def _backdate_recording_start(self, seconds: float) -> None:
+        self.service.recording_start_time = time.time() - seconds
+        self.service._recording_start_monotonic = time.monotonic() - seconds
+
     def _read_alert_events(self) -> list[dict]:
         if not self.service.alert_log_path.exists():
             return []
@@ -182,6 +187,15 @@ class TestRecordingService(unittest.TestCase):
         self.assertEqual(self.service.current_match_id, "match_partial")
         self.assertFalse(result["require_all_cameras"])
 
+    def test_is_recording_tracks_active_match(self) -> None:
+        self.assertFalse(self.service.is_recording())
+
+        result = self.service.start_recording("match_active", process_after_recording=False)
+
+        self.assertTrue(result["success"])
+        self.assertTrue(self.service.is_recording())
+        self.assertEqual(self.service.is_recording(), self.service.get_status()["recording"])
+
     def test_pipeline_error_auto_recovers_camera(self) -> None:
         self.service.max_recovery_attempts = 1
         self.service.recovery_backoff_seconds = 0.0
@@ -281,6 +295,21 @@ class TestRecordingService(unittest.TestCase):
         self.assertTrue(result["ok"])
         self.assertNotIn("nb_read_frames", result)
 
+    def test_probe_segment_integrity_keeps_only_stderr_tail(self) -> None:
+        segment = Path(self.temp_dir.name) / "probe_corrupt.mp4"
+        segment.write_bytes(b"probe-bytes")
+        stderr = "[mov] invalid packet\n" * 5000 + "moov atom not found\n"
+        completed = types.SimpleNamespace(returncode=1, stdout="", stderr=stderr)
+
+        with mock.patch.object(self.module.shutil, "which", return_value="/usr/bin/ffprobe"), mock.patch.object(
+            self.module.subprocess, "run", return_value=completed
+        ):
+            result = self.service._probe_segment_integrity(segment, time.time())
+
+        self.assertFalse(result["ok"])
+        self.assertLessEqual(len(result["error"]), 2048)
+        self.assertTrue(result["error"].endswith("moov atom not found"))
+
     def test_overload_guard_triggers_after_sustained_unhealthy_samples(self) -> None:
         self.service.overload_guard_unhealthy_streak_threshold = 2
         self.service.overload_guard_cpu_percent_threshold = 90.0
@@ -357,7 +386,7 @@ class TestRecordingService(unittest.TestCase):
     def test_stop_recording_returns_graceful_stop_metadata(self) -> None:
         start = self.service.start_recording("match_stop_metadata", process_after_recording=False)
         self.assertTrue(start["success"])
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
 
         stop = self.service.stop_recording(force=False)
         self.assertTrue(stop["success"])
@@ -375,7 +404,7 @@ class TestRecordingService(unittest.TestCase):
         self.service.stop_eos_timeout_seconds = 9.5
         start = self.service.start_recording("match_stop_timeout", process_after_recording=False)
         self.assertTrue(start["success"])
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
         self.service.gst_manager.stop_timeout_flags["recording_cam1"] = True
 
         stop = self.service.stop_recording(force=False)
@@ -390,18 +419,40 @@ class TestRecordingService(unittest.TestCase):
         event_types = [event.get("event_type") for event in self._read_alert_events()]
         self.assertIn("recording_stop_non_graceful", event_types)
 
+    def test_stop_recording_waits_for_camera_eos_concurrently(self) -> None:
+        start = self.service.start_recording("match_parallel_stop", process_after_recording=False)
+        self.assertTrue(start["success"])
+        self._backdate_recording_start(20)
+
+        # Each stop blocks until both cameras are stopping; a serial loop
+        # would break the barrier and report an error.
+        barrier = threading.Barrier(len(self.service.camera_ids), timeout=2.0)
+        fake_stop = self.service.gst_manager.stop_pipeline_with_details
+
+        def stop_with_barrier(name, wait_for_eos=True, timeout=5.0):
+            barrier.wait()
+            return fake_stop(name, wait_for_eos=wait_for_eos, timeout=timeout)
+
+        self.service.gst_manager.stop_pipeline_with_details = stop_with_barrier
+
+        stop = self.service.stop_recording(force=False)
+        self.assertTrue(stop["transport_success"])
+        self.assertEqual(list(stop["camera_stop_results"]), ["camera_0", "camera_1"])
+        for details in stop["camera_stop_results"].values():
+            self.assertTrue(details["finalized"])
+
     def test_stop_recording_integrity_gate_marks_failure_on_probe_error(self) -> None:
         match_id = "match_integrity_fail"
         start = self.service.start_recording(match_id, process_after_recording=False)
         self.assertTrue(start["success"])
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
 
         segments_dir = Path(self.temp_dir.name) / match_id / "segments"
         segments_dir.mkdir(parents=True, exist_ok=True)
         (segments_dir / "cam0_20260212_000000_00.mp4").write_bytes(b"cam0")
         (segments_dir / "cam1_20260212_000000_00.mp4").write_bytes(b"cam1")
 
-        def probe(path: Path, now: float) -> dict:
+        def probe(path: Path, now: float, st: object = None) -> dict:
             if "cam0_" in path.name:
                 return {"checked": True, "ok": False, "error": "moov atom not found", "cached": False}
             return {"checked": True, "ok": True, "error": None, "cached": False}
@@ -423,14 +474,14 @@ class TestRecordingService(unittest.TestCase):
         match_id = "match_integrity_ok"
         start = self.service.start_recording(match_id, process_after_recording=False)
         self.assertTrue(start["success"])
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
 
         segments_dir = Path(self.temp_dir.name) / match_id / "segments"
         segments_dir.mkdir(parents=True, exist_ok=True)
         (segments_dir / "cam0_20260212_000000_00.mp4").write_bytes(b"cam0")
         (segments_dir / "cam1_20260212_000000_00.mp4").write_bytes(b"cam1")
 
-        self.service._probe_segment_integrity = lambda path, now: {  # type: ignore[method-assign]
+        self.service._probe_segment_integrity = lambda path, now, st=None: {  # type: ignore[method-assign]
             "checked": True,
             "ok": True,
             "error": None,
@@ -448,7 +499,7 @@ class TestRecordingService(unittest.TestCase):
         match_id = "match_low_fps_alert"
         start = self.service.start_recording(match_id, process_after_recording=False)
         self.assertTrue(start["success"])
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
         self.service.slo_min_effective_fps = 24.0
 
         segments_dir = Path(self.temp_dir.name) / match_id / "segments"
@@ -456,7 +507,7 @@ class TestRecordingService(unittest.TestCase):
         (segments_dir / "cam0_20260212_000000_00.mp4").write_bytes(b"cam0")
         (segments_dir / "cam1_20260212_000000_00.mp4").write_bytes(b"cam1")
 
-        self.service._probe_segment_integrity = lambda path, now: {  # type: ignore[method-assign]
+        self.service._probe_segment_integrity = lambda path, now, st=None: {  # type: ignore[method-assign]
             "checked": True,
             "ok": True,
             "error": None,
@@ -483,7 +534,7 @@ class TestRecordingService(unittest.TestCase):
         start = self.service.start_recording("match_post", process_after_recording=True)
         self.assertTrue(start["success"])
         # Simulate elapsed time so non-force stop passes protection.
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
 
         stop = self.service.stop_recording(force=False)
         self.assertTrue(stop["success"])
@@ -500,9 +551,46 @@ class TestRecordingService(unittest.TestCase):
         self.assertIn("protected", status)
         self.assertTrue(status["protected"])
 
+    def test_get_status_does_not_wait_for_state_lock(self) -> None:
+        start = self.service.start_recording("match_status_lockfree", process_after_recording=False)
+        self.assertTrue(start["success"])
+        statuses = []
+
+        with self.service.state_lock:
+            reader = threading.Thread(target=lambda: statuses.append(self.service.get_status()))
+            reader.start()
+            reader.join(timeout=2.0)
+            self.assertFalse(reader.is_alive())
+
+        self.assertEqual(statuses[0]["match_id"], "match_status_lockfree")
+        self.assertIn("camera_0", statuses[0]["cameras"])
+
+    def test_get_status_duration_ignores_wall_clock_steps(self) -> None:
+        start = self.service.start_recording("match_clock_step", process_after_recording=False)
+        self.assertTrue(start["success"])
+        # Simulate NTP stepping the wall clock back an hour mid-match.
+        self.service.recording_start_time += 3600
+
+        status = self.service.get_status()
+        self.assertGreaterEqual(status["duration"], 0.0)
+        self.assertLess(status["duration"], 5.0)
+
+    def test_get_status_camera_uptime_ignores_wall_clock_steps(self) -> None:
+        start = self.service.start_recording("match_uptime_step", process_after_recording=False)
+        self.assertTrue(start["success"])
+        # Pipeline start stamps are wall clock; an NTP step makes them an hour old.
+        for cam_id in self.service.camera_ids:
+            status = self.service.gst_manager.statuses[f"recording_cam{cam_id}"]
+            status.start_time = datetime.utcnow() - timedelta(hours=1)
+
+        status = self.service.get_status()
+        for cam_status in status["cameras"].values():
+            self.assertGreaterEqual(cam_status["uptime"], 0.0)
+            self.assertLess(cam_status["uptime"], 5.0)
+
     def test_save_and_load_state_restores_active_recording(self) -> None:
         self.service.current_match_id = "match_state"
-        self.service.recording_start_time = time.time() - 30
+        self._backdate_recording_start(30)
         self.service.process_after_recording = True
         self.service._save_state()
 
@@ -515,6 +603,7 @@ class TestRecordingService(unittest.TestCase):
 
         self.assertEqual(second.current_match_id, "match_state")
         self.assertTrue(second.process_after_recording)
+        self.assertAlmostEqual(second.get_status()["duration"], 30.0, delta=2.0)
 
         saved = json.loads(self.service.state_file.read_text(encoding="utf-8"))
         self.assertEqual(saved["match_id"], "match_state")
@@ -522,14 +611,62 @@ class TestRecordingService(unittest.TestCase):
 
     def test_save_state_uses_atomic_replace_and_cleans_temp_file(self) -> None:
         self.service.current_match_id = "match_atomic"
-        self.service.recording_start_time = time.time() - 5
+        self._backdate_recording_start(5)
         self.service.process_after_recording = False
 
         self.service._save_state()
 
         self.assertTrue(self.service.state_file.exists())
-        tmp_state_file = self.service.state_file.with_name(f"{self.service.state_file.name}.tmp")
-        self.assertFalse(tmp_state_file.exists())
+        self.assertFalse(self.service._state_tmp_file().exists())
+        self.assertTrue(self.service._state_tmp_file().name.startswith("."))
+        self.assertEqual(list(self.service.state_file.parent.glob("*.tmp")), [])
+        self.assertEqual(list(self.service.state_file.parent.glob(".*.tmp")), [])
+
+    def test_latest_segments_picks_newest_file_per_camera(self) -> None:
+        segments_dir = Path(self.temp_dir.name) / "match_latest" / "segments"
+        segments_dir.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        for name, age in (
+            ("cam0_20260212_000000_00.mp4", 30),
+            ("cam0_20260212_000000_01.mp4", 5),
+            ("cam1_20260212_000000_00.mkv", 10),
+            ("cam1_20260212_000000_00.mp4.tmp", 0),
+            ("notes.txt", 0),
+        ):
+            path = segments_dir / name
+            path.write_bytes(b"data")
+            os.utime(path, (now - age, now - age))
+
+        latest = self.service._latest_segments(segments_dir)
+
+        self.assertEqual(latest[0][0].name, "cam0_20260212_000000_01.mp4")
+        self.assertEqual(latest[1][0].name, "cam1_20260212_000000_00.mkv")
+        self.assertEqual(latest[1][1].st_size, 4)
+
+    def test_latest_segments_reuses_scan_while_directory_unchanged(self) -> None:
+        segments_dir = Path(self.temp_dir.name) / "match_latest_cache" / "segments"
+        segments_dir.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        first = segments_dir / "cam0_20260212_000000_00.mp4"
+        first.write_bytes(b"data")
+        os.utime(first, (now - 30, now - 30))
+        os.utime(segments_dir, (now - 60, now - 60))
+
+        latest = self.service._latest_segments(segments_dir)
+        self.assertEqual(latest[0][0], first)
+
+        # A new entry behind an unchanged directory mtime is not rescanned,
+        # but the cached file is re-stat'ed so growing segments stay current.
+        first.write_bytes(b"more data")
+        (segments_dir / "cam0_20260212_000000_01.mp4").write_bytes(b"data")
+        os.utime(segments_dir, (now - 60, now - 60))
+        latest = self.service._latest_segments(segments_dir)
+        self.assertEqual(latest[0][0], first)
+        self.assertEqual(latest[0][1].st_size, 9)
+
+        os.utime(segments_dir, (now - 50, now - 50))
+        latest = self.service._latest_segments(segments_dir)
+        self.assertEqual(latest[0][0].name, "cam0_20260212_000000_01.mp4")
 
     def test_check_recording_health_no_active_recording(self) -> None:
         health = self.service.check_recording_health()
@@ -542,7 +679,7 @@ class TestRecordingService(unittest.TestCase):
         segments_dir.mkdir(parents=True, exist_ok=True)
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 20
+        self._backdate_recording_start(20)
         self._mark_recording_pipelines_running()
 
         health = self.service.check_recording_health()
@@ -564,7 +701,7 @@ class TestRecordingService(unittest.TestCase):
         os.utime(cam1, (stale, stale))
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 40
+        self._backdate_recording_start(40)
         self._mark_recording_pipelines_running()
 
         health = self.service.check_recording_health()
@@ -580,7 +717,7 @@ class TestRecordingService(unittest.TestCase):
         (segments_dir / "cam1_test_00.mp4").write_bytes(b"x" * 512)
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 5
+        self._backdate_recording_start(5)
         self._mark_recording_pipelines_running()
 
         health = self.service.check_recording_health()
@@ -594,7 +731,7 @@ class TestRecordingService(unittest.TestCase):
         (segments_dir / "cam0_test_00.mp4").write_bytes(b"x" * (1024 * 1024 + 1))
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 30
+        self._backdate_recording_start(30)
         self._mark_recording_pipelines_running()
 
         health = self.service.check_recording_health()
@@ -609,7 +746,7 @@ class TestRecordingService(unittest.TestCase):
         (segments_dir / "cam1_test_00.mp4").write_bytes(b"x" * (1024 * 1024 + 1))
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 40
+        self._backdate_recording_start(40)
         self._mark_recording_pipelines_running()
         self.service.gst_manager.statuses["recording_cam0"] = FakePipelineStatus(state="error")
 
@@ -630,7 +767,7 @@ class TestRecordingService(unittest.TestCase):
         os.utime(cam1, (stale, stale))
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 60
+        self._backdate_recording_start(60)
         self._mark_recording_pipelines_running()
 
         first = self.service.check_recording_health()
@@ -657,7 +794,7 @@ class TestRecordingService(unittest.TestCase):
         os.utime(cam1, (fresh, fresh))
 
         self.service.current_match_id = match_id
-        self.service.recording_start_time = time.time() - 80
+        self._backdate_recording_start(80)
         self._mark_recording_pipelines_running()
         self.service.health_last_segment_snapshot[0] = {
             "name": cam0.name,
@@ -667,7 +804,7 @@ class TestRecordingService(unittest.TestCase):
             "checked_at": time.time() - 15,
         }
 
-        self.service._probe_segment_integrity = lambda path, now: {
+        self.service._probe_segment_integrity = lambda path, now, st=None: {
             "checked": True,
             "ok": False,
             "error": "simulated_probe_failure",
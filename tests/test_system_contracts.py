@@ -100,6 +100,28 @@ class TestSystemContracts(unittest.TestCase):
         self.assertIn("or not status_after_stop.get('recording')", body)
         self.assertIn("pipeline_manager.release_lock(f\"api-recording-{match_id}\")", body)
 
+    def test_recording_start_waits_for_preview_teardown_unconditionally(self) -> None:
+        source = (ROOT / "src/platform/simple_api_v3.py").read_text(encoding="utf-8")
+        for pattern in (
+            r"def start_recording\(request: RecordingRequest\):(?P<body>.*?)recording_service\.start_recording\(",
+            r"if action == \"start_recording\":(?P<body>.*?)recording_service\.start_recording\(",
+        ):
+            section_match = re.search(pattern, source, flags=re.DOTALL)
+            self.assertIsNotNone(section_match, f"start_recording block not found: {pattern}")
+            body = section_match.group("body")
+            # At the handler's top indentation, not inside the preview_active branch.
+            self.assertRegex(body, r"\n {8}(if not )?preview_service\.wait_for_teardown\(")
+
+    def test_preview_stop_waits_for_teardown_before_releasing_lock(self) -> None:
+        source = (ROOT / "src/platform/simple_api_v3.py").read_text(encoding="utf-8")
+        for pattern in (
+            r"def stop_preview\(camera_id: Optional\[int\] = None\):(?P<body>.*?)release_lock",
+            r"elif action == \"stop_preview\":(?P<body>.*?)release_lock",
+        ):
+            section_match = re.search(pattern, source, flags=re.DOTALL)
+            self.assertIsNotNone(section_match, f"stop_preview block not found: {pattern}")
+            self.assertIn("preview_service.wait_for_teardown(timeout=2.0)", section_match.group("body"))
+
     def test_webrtc_signaling_handlers_are_registered(self) -> None:
         source = (ROOT / "src/platform/simple_api_v3.py").read_text(encoding="utf-8")
         self.assertIn("ws_manager.register_message_handler(_msg_type, _handle_webrtc_ws_message)", source)